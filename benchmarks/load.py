@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# load.py - Load generator for the HTTP transcription service (g2p.server),
+# reporting the throughput and the latency percentiles (Python 3)
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from urllib.parse import quote
+
+from .parallel import synthetic_words
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def request(reader, writer, host, method, path, body=b""):
+    """
+    Send a request on a keep-alive connection and read the response.
+
+    Returns: Status code and decoded JSON body
+
+    """
+    writer.write(
+        (
+            "{0} {1} HTTP/1.1\r\nHost: {2}\r\n"
+            "Content-Type: application/json\r\nContent-Length: {3}\r\n\r\n"
+        )
+        .format(method, path, host, len(body))
+        .encode("latin-1")
+        + body
+    )
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        header = await reader.readline()
+        if not header.strip():
+            break
+        name, _, value = header.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    return status, json.loads((await reader.readexactly(length)).decode("utf-8"))
+
+
+async def client(host, port, queue, latencies, errors, algorithm):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while not queue.empty():
+            words = queue.get_nowait()
+            if len(words) == 1:
+                method, body = "GET", b""
+                path = "/transcribe?word={0}&algorithm={1}".format(
+                    quote(words[0]), algorithm
+                )
+            else:
+                method, path = "POST", "/transcribe"
+                body = json.dumps({"words": words, "algorithm": algorithm})
+                body = body.encode("utf-8")
+            start = time.time()
+            status, _ = await request(reader, writer, host, method, path, body)
+            latencies.append(time.time() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p / 100.0))]
+
+
+async def run(args, words):
+    queue = asyncio.Queue()
+    for k in range(0, len(words), args.batch):
+        queue.put_nowait(words[k : k + args.batch])
+    latencies, errors = [], []
+    start = time.time()
+    await asyncio.gather(
+        *[
+            client(args.host, args.port, queue, latencies, errors, args.separator)
+            for _ in range(args.concurrency)
+        ]
+    )
+    elapsed = time.time() - start
+
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, stats = await request(reader, writer, args.host, "GET", "/stats")
+    writer.close()
+
+    latencies.sort()
+    print("requests     {0}".format(len(latencies)))
+    print("errors       {0}".format(len(errors)))
+    print("requests/s   {0:.0f}".format(len(latencies) / elapsed))
+    print("words/s      {0:.0f}".format(len(words) / elapsed))
+    for p in [50, 90, 99]:
+        print("p{0:<11} {1:.2f} ms".format(p, percentile(latencies, p) * 1e3))
+    print("max          {0:.2f} ms".format(latencies[-1] * 1e3))
+    print("server       {0}".format(stats))
+
+
+def wait_server(host, port, timeout=30.0):
+    async def health():
+        reader, writer = await asyncio.open_connection(host, port)
+        await request(reader, writer, host, "GET", "/health")
+        writer.close()
+
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return asyncio.run(health())
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument("--host", dest="host", default="127.0.0.1", help="Host")
+    parser.add_argument("-p", "--port", dest="port", default=8000, type=int)
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-n", "--number", dest="number", default=20000, type=int, help="Words"
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        dest="concurrency",
+        default=64,
+        type=int,
+        help="Concurrent connections (default: 64)",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        dest="batch",
+        default=1,
+        type=int,
+        help="Words per request, 1 for GET requests (default: 1)",
+    )
+    parser.add_argument(
+        "--serve",
+        dest="serve",
+        default=None,
+        help="Start 'python -m g2p.server' with these options, e.g. \"-w 2 -b 64\"",
+    )
+    args = parser.parse_args()
+
+    server = None
+    if args.serve is not None:
+        command = [sys.executable, "-m", "g2p.server", "-p", str(args.port)]
+        server = subprocess.Popen(command + args.serve.split(), cwd=ROOT)
+    try:
+        wait_server(args.host, args.port)
+        asyncio.run(run(args, synthetic_words(args.number)))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
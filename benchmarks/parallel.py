@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# parallel.py - Benchmark the words/second of transcribe_parallel versus the
+# number of worker processes.
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+from g2p.g2p import transcribe_iter
+from g2p.parallel import transcribe_parallel
+
+import codecs
+import multiprocessing
+import random
+import time
+
+# Syllables of the synthetic words
+SYLLABLES = (
+    "ca co de di fa gui lha ma nho pa que ra re sa ta te to tra vi ção ções "
+    "mos ram des in cons trans lé ní dor"
+).split()
+
+
+def synthetic_words(number, seed=0, syllables=(2, 6)):
+    """
+    Returns pseudo-words of 2 to 6 syllables, by default.
+
+    Args:
+        number: Number of words
+        seed: Random seed
+        syllables: Minimum and maximum number of syllables of a word
+
+    Returns: List of words, e.g. ["tracota", "conslédes"]
+
+    """
+    rnd = random.Random(seed)
+    return [
+        "".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(*syllables)))
+        for _ in range(number)
+    ]
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-f", "--file", dest="file", default=None, help="Word list, one per line"
+    )
+    parser.add_argument(
+        "-n", "--number", dest="number", default=50000, type=int, help="Words"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        default=None,
+        type=lambda x: [int(n) for n in x.split(",")],
+        help="Worker counts, e.g. 1,2,4,8 (default: powers of 2 up to the CPUs)",
+    )
+    parser.add_argument(
+        "-c", "--chunk", dest="chunk", default=1000, type=int, help="Chunk size"
+    )
+    args = parser.parse_args()
+
+    if args.file:
+        with codecs.open(args.file, "r", "utf-8") as f:
+            words = [line.strip().lower() for line in f][: args.number]
+    else:
+        words = synthetic_words(args.number)
+
+    workers = args.workers
+    if workers is None:
+        cpus, workers = multiprocessing.cpu_count(), [1]
+        while workers[-1] * 2 <= cpus:
+            workers.append(workers[-1] * 2)
+        if workers[-1] != cpus:
+            workers.append(cpus)
+
+    print("{0} words, {1} CPUs".format(len(words), multiprocessing.cpu_count()))
+    print("{0:<10} {1:>12} {2:>10}".format("workers", "words/s", "speedup"))
+
+    start = time.time()
+    for _ in transcribe_iter(words, args.separator, chunk=args.chunk):
+        pass
+    serial = len(words) / (time.time() - start)
+    print("{0:<10} {1:>12.0f} {2:>10.2f}".format("serial", serial, 1.0))
+
+    for n in workers:
+        start = time.time()
+        for _ in transcribe_parallel(words, args.separator, n, chunk=args.chunk):
+            pass
+        rate = len(words) / (time.time() - start)
+        print("{0:<10} {1:>12.0f} {2:>10.2f}".format(n, rate, rate / serial))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# rss.py - Measure the memory of each transcribing process of the HTTP
+# service (g2p.server), with worker processes or pre-forked (Linux, Python 3)
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# RSS counts the shared pages in every process; PSS divides them among the
+# processes sharing them, and USS (private) is what one more process costs.
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+from g2p.lexicon import build_lexicon
+from .load import ROOT, request, wait_server
+from .parallel import synthetic_words
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def memory(pid):
+    """
+    Returns: Dictionary of the "rss", "pss" and "uss" of a process, in KiB
+
+    """
+    fields = {}
+    with open("/proc/{0}/smaps_rollup".format(pid)) as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def children(pid):
+    """
+    Returns: List of the PIDs of the child processes of a process
+
+    """
+    with open("/proc/{0}/task/{0}/children".format(pid)) as f:
+        return [int(child) for child in f.read().split()]
+
+
+async def warm(host, port, words, batch, concurrency):
+    async def client(queue):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while not queue.empty():
+                body = json.dumps({"words": queue.get_nowait()}).encode("utf-8")
+                await request(reader, writer, host, "POST", "/transcribe", body)
+        finally:
+            writer.close()
+
+    queue = asyncio.Queue()
+    for k in range(0, len(words), batch):
+        queue.put_nowait(words[k : k + batch])
+    await asyncio.gather(*[client(queue) for _ in range(concurrency)])
+
+
+def measure(options, port, words, concurrency):
+    command = [sys.executable, "-m", "g2p.server", "-p", str(port)] + options
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL)
+    try:
+        wait_server("127.0.0.1", port)
+        asyncio.run(warm("127.0.0.1", port, words, 64, concurrency))
+        time.sleep(0.5)
+        parent = memory(server.pid)
+        processes = [memory(pid) for pid in children(server.pid)]
+    finally:
+        server.terminate()
+        server.wait()
+
+    return parent, processes
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument("-p", "--port", dest="port", default=8000, type=int)
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        default=[1, 2, 4, 8],
+        type=lambda x: [int(n) for n in x.split(",")],
+        help="Process counts, e.g. 1,2,4,8 (default: 1,2,4,8)",
+    )
+    parser.add_argument(
+        "-n", "--number", dest="number", default=20000, type=int, help="Words"
+    )
+    parser.add_argument(
+        "-L",
+        "--lexicon-words",
+        dest="lexicon_words",
+        default=50000,
+        type=int,
+        help="Words of the compiled lexicon, 0 for no lexicon (default: 50000)",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        dest="cache",
+        default=10000,
+        type=int,
+        help="LRU cache capacity of each process (default: 10000)",
+    )
+    args = parser.parse_args()
+
+    words = synthetic_words(args.number, seed=1)
+    options = ["-c", str(args.cache)]
+    directory = tempfile.mkdtemp()
+    try:
+        if args.lexicon_words > 0:
+            path = os.path.join(directory, "lexicon.bin")
+            build_lexicon(synthetic_words(args.lexicon_words), path, "silva")
+            options += ["-l", path]
+
+        print(
+            "{0:<10} {1:>6} {2:>12} {3:>12} {4:>12} {5:>12}".format(
+                "mode", "procs", "RSS/proc", "PSS/proc", "USS/proc", "PSS total"
+            )
+        )
+        for mode, flag in [("workers", "-w"), ("prefork", "-P")]:
+            for n in args.workers:
+                parent, processes = measure(
+                    options + [flag, str(n)], args.port, words, 4 * n
+                )
+                total = parent["pss"] + sum(p["pss"] for p in processes)
+                print(
+                    "{0:<10} {1:>6} {2:>9} KiB {3:>8} KiB {4:>8} KiB {5:>8} KiB".format(
+                        mode,
+                        n,
+                        sum(p["rss"] for p in processes) // len(processes),
+                        sum(p["pss"] for p in processes) // len(processes),
+                        sum(p["uss"] for p in processes) // len(processes),
+                        total,
+                    )
+                )
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# startup.py - Benchmark the cold start of test_word.py-style invocations,
+# i.e. a new Python process importing g2p and transcribing a single word.
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORD = (
+    "from g2p.g2p import G2PTranscriber; "
+    "G2PTranscriber('molho', '{0}').transcriber()"
+)
+
+# Loads everything at import, as g2p.g2p did before the lazy loading
+EAGER = (
+    "import g2p.g2p as g; "
+    "g.get_prefixes(); g.get_homographs_heterophones(); "
+    "import syllables.silva2011, syllables.ceci; "
+    "g.G2PTranscriber('molho', '{0}').transcriber()"
+)
+
+SCENARIOS = [
+    ("python (interpreter only)", "pass"),
+    ("import g2p.g2p", "import g2p.g2p"),
+    ("word, eager loading", EAGER),
+    ("word, lazy loading", WORD),
+]
+
+
+def run(code, number):
+    """
+    Returns the wall times of running some code in new Python processes.
+
+    Args:
+        code: Python code, e.g. "import g2p.g2p"
+        number: Number of processes
+
+    Returns: List of times in seconds
+
+    """
+    times = []
+    for _ in range(number):
+        start = time.time()
+        subprocess.check_call([sys.executable, "-c", code], cwd=ROOT)
+        times.append(time.time() - start)
+
+    return times
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-n", "--number", dest="number", default=20, type=int, help="Processes"
+    )
+    args = parser.parse_args()
+
+    # Build the bytecode once
+    run(WORD.format(args.separator), 1)
+
+    print("{0:<32} {1:>10} {2:>10}".format("scenario", "best ms", "median ms"))
+    for name, code in SCENARIOS:
+        times = sorted(run(code.format(args.separator), args.number))
+        print(
+            "{0:<32} {1:>10.1f} {2:>10.1f}".format(
+                name, times[0] * 1e3, times[len(times) // 2] * 1e3
+            )
+        )
@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# suite.py - Benchmark the stress detection, the syllabification and the
+# transcription stages, separately and end to end, over the bundled word
+# lists; save the results as JSON and compare them with a previous run.
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# Usage:
+#
+#   python -m benchmarks.suite -o before.json
+#   (change the code)
+#   python -m benchmarks.suite -o after.json -b before.json -t 10
+#
+# The second run exits with status 1 if the throughput of a stage over a word
+# list drops more than 10% below before.json, or if a list or a stage of this
+# run cannot be compared with before.json (missing, or another number of
+# words).
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from collections import OrderedDict
+
+from g2p.g2p import G2PTranscriber, transcribe_many, preload
+from g2p.g2p import count_many, syllabify_many, stress_many
+
+from stress.tonic import StressDetector
+
+from syllables.silva2011 import Silva2011SyllableSeparator
+from syllables.ceci import CECISyllableSeparator
+
+from .parallel import synthetic_words
+
+import codecs
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import timeit
+
+WORDS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words")
+
+# Bundled word lists: common.txt holds real words; short, mixed and long are
+# synthetic words, generated by --generate as (number, seed, syllables)
+SYNTHETIC = OrderedDict(
+    [
+        ("short", (2000, 11, (1, 2))),
+        ("mixed", (10000, 12, (2, 6))),
+        ("long", (2000, 13, (5, 8))),
+    ]
+)
+
+# Real words with the syllables of the synthetic lists, the most frequent
+# ones of a word list given to --real, as (number, syllables). The bundled
+# lists come from the Portuguese word frequencies of wordfreq 3.1.1, by Robyn
+# Speer, under CC BY-SA 4.0 (https://github.com/rspeer/wordfreq)
+REAL = OrderedDict(
+    [
+        ("real-short", (2000, (1, 2))),
+        ("real-mixed", (10000, (2, 6))),
+        ("real-long", (2000, (5, 8))),
+    ]
+)
+
+LISTS = ["common"] + list(SYNTHETIC) + list(REAL)
+
+
+def load_words(name):
+    """
+    Returns the words of a bundled word list.
+
+    Args:
+        name: Name of the list, e.g. "common"
+
+    Returns: List of words
+
+    """
+    path = os.path.join(WORDS, name + ".txt")
+    with codecs.open(path, "r", "utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def transcribable(word):
+    """
+    Returns True if every stage can process the word, since some words
+    break the rules (e.g. IndexError)
+
+    """
+    try:
+        for algorithm in ["silva", "ceci"]:
+            transcribe_many([word], algorithm)
+        Silva2011SyllableSeparator(
+            word, StressDetector(word).get_stress_vowel()
+        ).separate()
+        CECISyllableSeparator(word).separate()
+    except (IndexError, ValueError):
+        return False
+    return True
+
+
+def generate():
+    """
+    Write the synthetic word lists, without the words some stage cannot
+    process, and filter common.txt the same way.
+
+    """
+    for name, (number, seed, syllables) in SYNTHETIC.items():
+        words = []
+        while len(words) < number:
+            candidates = synthetic_words(number, seed + len(words), syllables)
+            words.extend(w for w in candidates if transcribable(w))
+        _write_words(name, words[:number])
+    _write_words("common", [w for w in load_words("common") if transcribable(w)])
+
+
+def generate_real(path):
+    """
+    Write the real word lists from a word list, taking for each one the
+    most frequent words with its number of syllables (Silva) that every
+    stage can process.
+
+    Args:
+        path: Words, one per line, from the most frequent, e.g. those of
+            wordfreq (https://github.com/rspeer/wordfreq) for Portuguese
+
+    """
+    with codecs.open(path, "r", "utf-8") as f:
+        source = [line.strip().lower() for line in f]
+    for name, (number, (low, high)) in REAL.items():
+        words, seen = [], set()
+        for word in source:
+            if len(words) == number:
+                break
+            if word in seen or not word.isalpha() or not transcribable(word):
+                continue
+            seen.add(word)
+            if low <= len(G2PTranscriber(word).get_syllables()) <= high:
+                words.append(word)
+        _write_words(name, words)
+
+
+def _write_words(name, words):
+    path = os.path.join(WORDS, name + ".txt")
+    with io.open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("".join(word + "\n" for word in words))
+
+
+def stages(words):
+    """
+    Returns the stages to benchmark over a word list. The setup of a stage
+    prepares its input untimed, e.g. the stress vowels for the Silva
+    separator, or the transcribers whose rules alone are timed. The
+    count, syllabify and stress stages time the fast paths end to end.
+
+    Args:
+        words: List of words
+
+    Returns: OrderedDict of name -> (setup, function), function taking the
+        result of setup
+
+    """
+    stresses = [StressDetector(w).get_stress_vowel() for w in words]
+
+    def stress(_):
+        for word in words:
+            StressDetector(word).get_stress_vowel()
+
+    def silva(_):
+        for word, vowel in zip(words, stresses):
+            Silva2011SyllableSeparator(word, vowel).separate()
+
+    def ceci(_):
+        for word in words:
+            CECISyllableSeparator(word).separate()
+
+    def transcribers():
+        g2ps = [G2PTranscriber(word, algorithm="silva") for word in words]
+        for g2p in g2ps:
+            # Separate the syllables before timing the rules alone
+            g2p.get_syllables()
+        return g2ps
+
+    def transcriber(g2ps):
+        for g2p in g2ps:
+            # Drop the phones cached by the previous pass
+            g2p._phones = None
+            g2p.transcriber()
+
+    return OrderedDict(
+        [
+            ("stress", (None, stress)),
+            ("silva", (None, silva)),
+            ("ceci", (None, ceci)),
+            ("transcriber", (transcribers, transcriber)),
+            ("end-to-end-silva", (None, lambda _: transcribe_many(words, "silva"))),
+            ("end-to-end-ceci", (None, lambda _: transcribe_many(words, "ceci"))),
+            # Fast paths, without the phonetic rules
+            ("count-silva", (None, lambda _: count_many(words, "silva"))),
+            ("count-ceci", (None, lambda _: count_many(words, "ceci"))),
+            ("syllabify-silva", (None, lambda _: syllabify_many(words, "silva"))),
+            ("syllabify-ceci", (None, lambda _: syllabify_many(words, "ceci"))),
+            ("stress-silva", (None, lambda _: stress_many(words, "silva"))),
+            ("stress-ceci", (None, lambda _: stress_many(words, "ceci"))),
+        ]
+    )
+
+
+def best_time(setup, function, repeat, min_time=0.2):
+    """
+    Returns the best time, in seconds, of one pass of function over `repeat`
+    runs. Each run makes enough passes to last min_time seconds, so that
+    the short word lists are timed as reliably as the long ones.
+
+    """
+    prepared = setup() if setup is not None else None
+    number = 1
+    while True:
+        seconds = _time(function, prepared, number)
+        if seconds >= min_time:
+            break
+        number *= 2 if seconds <= 0 else max(2, int(min_time / seconds) + 1)
+    times = [seconds]
+    for _ in range(repeat - 1):
+        times.append(_time(function, prepared, number))
+    return min(times) / number
+
+
+def _time(function, prepared, number):
+    start = timeit.default_timer()
+    for _ in range(number):
+        function(prepared)
+    return timeit.default_timer() - start
+
+
+def run(lists, repeat=5, only=None):
+    """
+    Benchmark the stages over word lists.
+
+    Args:
+        lists: Names of the word lists
+        repeat: Number of runs, the best one is kept
+        only: Names of the stages to run, or None for all of them
+
+    Returns: Dictionary of the results, ready to be saved as JSON
+
+    """
+    preload("silva")
+    preload("ceci")
+    results = OrderedDict()
+    for name in lists:
+        words = load_words(name)
+        results[name] = OrderedDict([("words", len(words)), ("stages", OrderedDict())])
+        for stage, (setup, function) in stages(words).items():
+            if only and stage not in only:
+                continue
+            seconds = best_time(setup, function, repeat)
+            results[name]["stages"][stage] = OrderedDict(
+                [
+                    ("words_per_s", len(words) / seconds),
+                    ("us_per_word", seconds / len(words) * 1e6),
+                ]
+            )
+            print(
+                "{0:<10} {1:<18} {2:>12.0f} {3:>12.2f}".format(
+                    name,
+                    stage,
+                    results[name]["stages"][stage]["words_per_s"],
+                    results[name]["stages"][stage]["us_per_word"],
+                )
+            )
+            sys.stdout.flush()
+
+    return OrderedDict(
+        [
+            ("date", datetime.datetime.now().isoformat()),
+            ("python", platform.python_version()),
+            ("platform", platform.platform()),
+            ("repeat", repeat),
+            ("results", results),
+        ]
+    )
+
+
+def compare(current, baseline, threshold):
+    """
+    Compare the throughput of two runs.
+
+    Args:
+        current: Results of this run, as returned by run
+        baseline: Results of a previous run
+        threshold: Maximum drop of throughput, in percent
+
+    Returns: (regressions, skipped), the lists of (list, stage, baseline
+        words/s, words/s, change in %) of the regressions and of (list,
+        stage, reason) of the stages that cannot be compared
+
+    """
+    regressions, skipped = [], []
+    print(
+        "\n{0:<10} {1:<18} {2:>12} {3:>12} {4:>8}".format(
+            "list", "stage", "baseline", "words/s", "change"
+        )
+    )
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        reason = None
+        if base is None:
+            reason = "not in the baseline"
+        elif base["words"] != result["words"]:
+            reason = "{0} words, {1} in the baseline".format(
+                result["words"], base["words"]
+            )
+        for stage, values in result["stages"].items():
+            missing = reason
+            if missing is None and stage not in base["stages"]:
+                missing = "not in the baseline"
+            if missing is not None:
+                print("{0:<10} {1:<18} SKIPPED: {2}".format(name, stage, missing))
+                skipped.append((name, stage, missing))
+                continue
+            before = base["stages"][stage]["words_per_s"]
+            after = values["words_per_s"]
+            change = (after - before) / before * 100.0
+            regressed = change < -threshold
+            print(
+                "{0:<10} {1:<18} {2:>12.0f} {3:>12.0f} {4:>+7.1f}%{5}".format(
+                    name,
+                    stage,
+                    before,
+                    after,
+                    change,
+                    "  REGRESSION" if regressed else "",
+                )
+            )
+            if regressed:
+                regressions.append((name, stage, before, after, change))
+
+    return regressions, skipped
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-l",
+        "--lists",
+        dest="lists",
+        default=LISTS,
+        type=lambda x: x.split(","),
+        help="Word lists, e.g. common,long (default: {0})".format(",".join(LISTS)),
+    )
+    parser.add_argument(
+        "-S",
+        "--stages",
+        dest="stages",
+        default=None,
+        type=lambda x: x.split(","),
+        help="Stages to run, e.g. stress,silva (default: all)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", default=5, type=int, help="Number of runs"
+    )
+    parser.add_argument(
+        "-o", "--output", dest="output", default=None, help="Save the results as JSON"
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        dest="baseline",
+        default=None,
+        help="Results of a previous run to compare with (JSON)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        dest="threshold",
+        default=10.0,
+        type=float,
+        help="Fail if a throughput drops more than this percent (default: 10)",
+    )
+    parser.add_argument(
+        "--generate",
+        dest="generate",
+        action="store_true",
+        help="Regenerate the bundled word lists and exit",
+    )
+    parser.add_argument(
+        "--real",
+        dest="real",
+        default=None,
+        help="Rebuild the real-short, real-mixed and real-long lists from a "
+        "file of words, one per line from the most frequent, and exit",
+    )
+    args = parser.parse_args()
+
+    if args.generate:
+        generate()
+        sys.exit(0)
+    if args.real:
+        generate_real(args.real)
+        sys.exit(0)
+
+    unknown = set(args.lists) - set(LISTS)
+    if unknown:
+        parser.error("unknown word lists: {0}".format(", ".join(sorted(unknown))))
+
+    print(
+        "{0:<10} {1:<18} {2:>12} {3:>12}".format("list", "stage", "words/s", "us/word")
+    )
+    current = run(args.lists, args.repeat, args.stages)
+
+    if args.output:
+        with io.open(args.output, "w", encoding="utf-8") as f:
+            f.write(json.dumps(current, indent=2, ensure_ascii=False) + "\n")
+
+    if args.baseline:
+        with io.open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions, skipped = compare(current, baseline, args.threshold)
+        errors = []
+        if regressions:
+            errors.append(
+                "{0} regression(s) beyond {1}%: {2}".format(
+                    len(regressions),
+                    args.threshold,
+                    ", ".join("{0}/{1}".format(r[0], r[1]) for r in regressions),
+                )
+            )
+        if skipped:
+            errors.append(
+                "{0} stage(s) not compared with the baseline: {1}".format(
+                    len(skipped),
+                    ", ".join("{0}/{1}".format(s[0], s[1]) for s in skipped),
+                )
+            )
+        if errors:
+            sys.exit("\n" + "\n".join(errors))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# syllables.py - Benchmark the syllable separators
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+from stress.tonic import StressDetector
+
+from syllables.silva2011 import Silva2011SyllableSeparator
+from syllables.ceci import CECISyllableSeparator
+
+from .transcriber import WORDS
+
+import timeit
+
+
+def separators(word):
+    """
+    Returns the functions to benchmark for a word.
+
+    Args:
+        word: Input word, e.g. "chocolate"
+
+    Returns: List of (name, function)
+
+    """
+    stress = StressDetector(word).get_stress_vowel()
+    return [
+        ("silva", lambda: Silva2011SyllableSeparator(word, stress).separate()),
+        ("ceci", lambda: CECISyllableSeparator(word).separate()),
+        ("ceci-count", lambda: CECISyllableSeparator(word).no_syllables(word)),
+    ]
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-n", "--number", dest="number", default=2000, type=int, help="Calls per run"
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", default=5, type=int, help="Number of runs"
+    )
+    args = parser.parse_args()
+
+    print("{0:<48} {1:<12} {2:>12}".format("word", "separator", "us/call"))
+    for word in WORDS:
+        for name, function in separators(word):
+            best = min(timeit.repeat(function, number=args.number, repeat=args.repeat))
+            print(
+                "{0:<48} {1:<12} {2:>12.2f}".format(
+                    word, name, best / args.number * 1e6
+                )
+            )
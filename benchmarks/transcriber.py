@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# transcriber.py - Benchmark G2PTranscriber.transcriber on long words and
+# compounds (time and memory per call), and profile its stress predicates
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+from g2p import g2p as g2p_module
+from g2p import index as index_module
+from g2p.g2p import G2PTranscriber
+
+import cProfile
+import pstats
+import sys
+import timeit
+import tracemalloc
+
+
+# Long words and compounds, where the output string is rebuilt the most
+WORDS = [
+    "casa",
+    "chocolate",
+    "paralelepípedo",
+    "otorrinolaringologista",
+    "desproporcionadamente",
+    "anticonstitucionalissimamente",
+    "oftalmotorrinolaringologista",
+    "pneumoultramicroscopicossilicovulcanoconiótico",
+]
+
+
+def measure(word, algorithm, number, repeat):
+    """
+    Time and memory of transcriber() on a word.
+
+    Args:
+        word: Input word, e.g. "chocolate"
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        number: Calls per run
+        repeat: Number of runs, the best one is kept
+
+    Returns: (phones, us per call, peak bytes allocated during a call)
+
+    """
+    g2p = G2PTranscriber(word, algorithm=algorithm)
+    g2p.get_syllables()
+
+    def transcribe():
+        # Drop the phones cached by the previous call
+        g2p._phones = None
+        return g2p.transcriber()
+
+    best = min(timeit.repeat(transcribe, number=number, repeat=repeat))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        phones = transcribe()
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    return phones, best / number * 1e6, peak
+
+
+def profile(words, algorithm):
+    """
+    Profile transcriber() over a word list, and returns the time spent in
+    the stress and last syllable predicates (SyllableIndex) and in building
+    the syllable index, against the time of the transcriber.
+
+    Args:
+        words: List of words
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    Returns: List of (function, calls, seconds, share of the transcriber),
+        the first row being the transcriber itself
+
+    """
+    g2ps = [G2PTranscriber(word, algorithm=algorithm) for word in words]
+    for g2p in g2ps:
+        g2p.get_syllables()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for g2p in g2ps:
+        g2p._phones, g2p.index = None, None
+        g2p.transcriber()
+    profiler.disable()
+
+    rows, total = [], None
+    for (path, _, name), values in pstats.Stats(profiler).stats.items():
+        calls, seconds = values[1], values[3]
+        if name == "transcriber" and path == g2p_module.__file__:
+            total = seconds
+            rows.insert(0, ("G2PTranscriber.transcriber", calls, seconds))
+        elif path == index_module.__file__ and not name.startswith("<"):
+            rows.append(("SyllableIndex." + name, calls, seconds))
+        elif name == "get_syllable_index":
+            # Includes finding the stress syllable in the syllables
+            rows.append(("G2PTranscriber." + name, calls, seconds))
+
+    return [(name, calls, s, s / total) for name, calls, s in rows]
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-n", "--number", dest="number", default=500, type=int, help="Calls per run"
+    )
+    parser.add_argument(
+        "-r", "--repeat", dest="repeat", default=5, type=int, help="Number of runs"
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        dest="profile",
+        action="store_true",
+        help="Profile the stress predicates over benchmarks/words/common.txt",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        from .suite import load_words
+
+        print("{0:<34} {1:>7} {2:>8} {3:>7}".format("function", "calls", "s", "share"))
+        for row in profile(load_words("common"), args.separator):
+            print("{0:<34} {1:>7} {2:>8.4f} {3:>6.1%}".format(*row))
+        sys.exit(0)
+
+    print(
+        "{0:<32} {1:>5} {2:>8} {3:>10}  {4}".format(
+            "word", "chars", "us/call", "peak bytes", "phones"
+        )
+    )
+    for word in WORDS:
+        phones, us, peak = measure(word, args.separator, args.number, args.repeat)
+        print(
+            "{0:<32} {1:>5} {2:>8.1f} {3:>10}  {4}".format(
+                word[:32], len(word), us, peak, phones
+            )
+        )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# cache.py - Bounded LRU cache of the transcriber results
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+import threading
+
+
+class LRUCache(object):
+    """
+    Size-bounded cache of the transcriber results, keyed by
+    (normalized word, algorithm). When the cache is full the least recently
+    used word is evicted, so the memory stays bounded in long-running
+    processes. The cache can be shared between threads.
+
+    """
+
+    def __init__(self, capacity=10000):
+        if capacity < 1:
+            raise ValueError("the cache capacity must be at least 1")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, word, algorithm):
+        """
+        Returns the cached result of a word and marks it as recently used.
+
+        Args:
+            word: Normalized word, e.g. "guerra"
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+
+        Returns: Copy of the cached result, or None on a miss
+
+        """
+        key = (word, algorithm)
+        with self._lock:
+            result = self._data.pop(key, None)
+            if result is None:
+                self.misses += 1
+                return None
+            # Move the word to the end, i.e. most recently used
+            self._data[key] = result
+            self.hits += 1
+
+        return dict(result)
+
+    def put(self, word, algorithm, result):
+        """
+        Store the result of a word, evicting the least recently used words
+        beyond the capacity.
+
+        Args:
+            word: Normalized word, e.g. "guerra"
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+            result: Dictionary with the transcription, syllables and stress
+                syllables of the word
+
+        """
+        key = (word, algorithm)
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = dict(result)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all the words and reset the statistics.
+
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Returns the cache statistics.
+
+        Returns: Dictionary, e.g.
+            {"size": 2, "capacity": 100, "hits": 8, "misses": 2,
+             "evictions": 0, "hit_rate": 0.8}
+
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# coprocess.py - Long-lived transcriber speaking JSON lines on stdin/stdout,
+# to be embedded in pipelines written in other languages (Python 3)
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# Protocol, one JSON object per line:
+#
+#   {"id": 1, "word": "guerra"}
+#       -> {"id": 1, "result": {"word": "guerra", "transcription": ...}}
+#   {"id": 2, "words": ["casa", "molho"], "algorithm": "ceci",
+#    "outputs": ["syllables"]}
+#       -> {"id": 2, "results": [{"word": "casa", "syllables": "ca-sa"}, ...]}
+#   malformed request -> {"id": ..., "error": "..."}
+#
+# The id is optional and returned as is; the responses come in the order of
+# the requests. The requests already written when the co-process reads its
+# input (pipelining) are transcribed together, and their responses flushed
+# at once. The requests without "transcription" among their outputs skip the
+# phonetic rules.
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from collections import OrderedDict
+
+from .lexicon import check_lexicon
+from .worker import ALGORITHMS, MAX_WORDS, init_worker, transcribe_batch
+from .worker import syllabify_batch
+
+import json
+import os
+import sys
+
+OUTPUTS = ["transcription", "syllables", "stress_syllables"]
+
+# Bytes read from the input at a time
+READ_SIZE = 1 << 16
+
+
+def parse_request(line, algorithm="silva"):
+    """
+    Parse and validate a request line.
+
+    Args:
+        line: Request, a JSON object in UTF-8 bytes
+        algorithm: Default syllabification algorithm
+
+    Returns: Dictionary with the "id", "words", "algorithm", "outputs" and
+        "single" (True for a "word" request) of the request
+
+    Raises: ValueError for a malformed request, with the id found (if any)
+        as its second argument
+
+    """
+    try:
+        request = json.loads(line.decode("utf-8"))
+    except ValueError:
+        raise ValueError("malformed JSON", None)
+    if not isinstance(request, dict):
+        raise ValueError("expected a JSON object", None)
+
+    request_id = request.get("id")
+    single = "words" not in request
+    words = [request.get("word")] if single else request["words"]
+    if not isinstance(words, list) or not all(
+        isinstance(w, type("")) and w.strip() for w in words
+    ):
+        raise ValueError("words must be non-empty strings", request_id)
+    if len(words) > MAX_WORDS:
+        raise ValueError("too many words", request_id)
+    algorithm = request.get("algorithm", algorithm)
+    if algorithm not in ALGORITHMS:
+        raise ValueError("unknown algorithm", request_id)
+    outputs = request.get("outputs", OUTPUTS)
+    if not isinstance(outputs, list) or not all(
+        isinstance(output, type("")) and output in OUTPUTS for output in outputs
+    ):
+        raise ValueError("outputs must be among " + ", ".join(OUTPUTS), request_id)
+
+    return {
+        "id": request_id,
+        "words": [w.strip() for w in words],
+        "algorithm": algorithm,
+        "outputs": outputs,
+        "single": single,
+    }
+
+
+def _batch(request):
+    # Requests transcribed together: same algorithm, and with or without
+    # the phonetic rules
+    return request["algorithm"], "transcription" in request["outputs"]
+
+
+def _transcribe(batch, words):
+    algorithm, rules = batch
+    if rules:
+        return transcribe_batch(words, algorithm)
+    return syllabify_batch(words, algorithm)
+
+
+def _response(request, results):
+    items = []
+    for result in results:
+        if "error" not in result:
+            result = dict(
+                [("word", result["word"])]
+                + [(key, result[key]) for key in request["outputs"]]
+            )
+        items.append(result)
+    if request["single"]:
+        return {"id": request["id"], "result": items[0]}
+    return {"id": request["id"], "results": items}
+
+
+def handle(lines, algorithm="silva"):
+    """
+    Answer a batch of requests, transcribing the words of all the requests
+    with one call per algorithm (and per use of the phonetic rules). A
+    request that fails gets an error response, the others are answered.
+
+    Args:
+        lines: List of request lines, in UTF-8 bytes
+        algorithm: Default syllabification algorithm
+
+    Returns: List of response dictionaries, in the order of the requests
+
+    """
+    requests, words = [], OrderedDict()
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            request = parse_request(line, algorithm)
+            words.setdefault(_batch(request), []).extend(request["words"])
+        except ValueError as e:
+            request = {"id": e.args[1], "error": e.args[0]}
+        except Exception:
+            request = {"id": None, "error": "malformed request"}
+        requests.append(request)
+
+    results = {}
+    for batch in words:
+        try:
+            results[batch] = iter(list(_transcribe(batch, words[batch])))
+        except Exception:
+            # Transcribed again request by request, so that only the
+            # failing requests get an error
+            results[batch] = None
+
+    responses = []
+    for request in requests:
+        if "error" in request:
+            responses.append(request)
+            continue
+        batch = _batch(request)
+        try:
+            if results[batch] is None:
+                items = _transcribe(batch, request["words"])
+            else:
+                items = [next(results[batch]) for _ in request["words"]]
+            responses.append(_response(request, items))
+        except Exception:
+            responses.append({"id": request["id"], "error": "internal error"})
+
+    return responses
+
+
+def run(f_in, f_out, algorithm="silva"):
+    """
+    Answer the requests of f_in on f_out until the end of f_in.
+
+    Args:
+        f_in: Binary input, e.g. sys.stdin.buffer
+        f_out: Binary output, e.g. sys.stdout.buffer
+        algorithm: Default syllabification algorithm
+
+    """
+    pending = b""
+    while True:
+        # read1 returns what is available, without waiting for more
+        data = f_in.read1(READ_SIZE)
+        if not data:
+            break
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        _write(f_out, handle(lines, algorithm))
+    if pending.strip():
+        _write(f_out, handle([pending], algorithm))
+
+
+def _write(f_out, responses):
+    if not responses:
+        return
+    f_out.write(
+        b"".join(
+            json.dumps(r, ensure_ascii=False).encode("utf-8") + b"\n"
+            for r in responses
+        )
+    )
+    f_out.flush()
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(description="JSON-lines transcriber on stdin/stdout")
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=ALGORITHMS,
+        help="Default separator/syllabification algorithm (default: silva)",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        dest="cache",
+        default=10000,
+        type=int,
+        help="Cache the results of the N most recently used words "
+        "(default: 10000)",
+    )
+    parser.add_argument(
+        "-l",
+        "--lexicon",
+        dest="lexicon",
+        default=None,
+        help="Compiled lexicon looked up before the rules (python -m g2p.lexicon)",
+    )
+    args = parser.parse_args()
+    if args.lexicon and not os.path.exists(args.lexicon):
+        parser.error('the file "%s" does not exist!' % args.lexicon)
+    if args.lexicon:
+        check_lexicon(args.lexicon)
+
+    init_worker(args.cache, args.lexicon)
+    try:
+        run(sys.stdin.buffer, sys.stdout.buffer, args.separator)
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# explain.py - Trace the path of a word through the rules: prefixes, stress,
+# Silva (2011) syllable separation and transcriber
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# Like RuleCounter (rulestats.py), the trace is taken by a trace function set
+# only for the word explained: the rules are not instrumented, so they pay
+# nothing when no word is being explained.
+
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+from .g2p import G2PTranscriber, get_homographs_heterophones, normalize_word
+from .rulestats import rule_lines
+
+from stress.tonic import StressDetector, SUFFIXES
+
+from syllables import cases
+from syllables.silva2011 import Silva2011SyllableSeparator
+
+import dis
+import inspect
+import io
+import re
+import sys
+
+# Line maps of the traced functions, built at the first explain
+_maps = {}
+
+
+def stress_sections(function):
+    """
+    Split a function into sections, each one starting at a "# Rule" comment.
+
+    Args:
+        function: Function, e.g. StressDetector.find_stress_vowel
+
+    Returns: List of (first line, label), e.g. [(176, "Rule 1"), ...]
+
+    """
+    code = function.__code__
+    with io.open(inspect.getsourcefile(function), "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    end = max(line for _, line in dis.findlinestarts(code))
+    sections = []
+    for k in range(code.co_firstlineno, end):
+        text = lines[k - 1].strip()
+        if re.match(r"#\s*Rules?\s", text):
+            sections.append((k, text.lstrip("#").strip().rstrip(":")))
+    return sections
+
+
+def _section(sections, line):
+    label = None
+    for first, name in sections:
+        if first <= line:
+            label = name
+    return label
+
+
+def _after_loop(function, text):
+    # First line of a function containing text, e.g. the first statement
+    # after its main loop
+    lines, first = inspect.getsourcelines(function)
+    for k, line in enumerate(lines):
+        if text in line:
+            return first + k
+    return None
+
+
+def _maps_of_rules():
+    if not _maps:
+        _maps["transcriber"] = rule_lines(G2PTranscriber.transcriber, "transcriber")
+        _maps["transcriber_end"] = _after_loop(
+            G2PTranscriber.transcriber, "get_stress_phonetic_syllable"
+        )
+        _maps["silva"] = rule_lines(Silva2011SyllableSeparator.separate, "silva")
+        _maps["stress"] = stress_sections(StressDetector.find_stress_vowel)
+        _maps["cases"] = dict(
+            (getattr(cases, name).__code__, name)
+            for name in dir(cases)
+            if re.match(r"case\d+$", name)
+        )
+    return _maps
+
+
+def _event(stage, rule, input=None, output=None, string=None, description=""):
+    return OrderedDict(
+        [
+            ("stage", stage),
+            ("rule", rule),
+            ("input", input),
+            ("output", output),
+            ("string", string),
+            ("description", description),
+        ]
+    )
+
+
+class _Tracer(object):
+    """
+    Trace function recording the rules fired, in order.
+
+    """
+
+    def __init__(self):
+        maps = _maps_of_rules()
+        self.transcriber = maps["transcriber"]
+        self.transcriber_end = maps["transcriber_end"]
+        self.silva = maps["silva"]
+        self.stress = maps["stress"]
+        self.cases = maps["cases"]
+        self.trace = []
+        # Transcriber event waiting for the phones its rule wrote
+        self._pending = None
+
+    def __call__(self, frame, event, arg):
+        code = frame.f_code
+        if code is G2PTranscriber.transcriber.__code__:
+            return self._trace_transcriber
+        if code is Silva2011SyllableSeparator.separate.__code__:
+            return self._trace_silva
+        if code is StressDetector.find_stress_vowel.__code__:
+            return self._trace_stress
+        if code is G2PTranscriber.pre_transcriber.__code__:
+            return self._trace_prefix
+        if code in self.cases:
+            return self._trace_case
+        return None
+
+    def _flush(self, frame):
+        if self._pending is not None:
+            self._pending["string"] = frame.f_locals.get("w")
+            self._pending = None
+
+    def _trace_transcriber(self, frame, event, arg):
+        if event == "line":
+            rules = self.transcriber.get(frame.f_lineno)
+            if rules:
+                self._flush(frame)
+                local = frame.f_locals
+                for stage, name, description in rules:
+                    self.trace.append(
+                        _event(
+                            stage,
+                            name,
+                            local.get("i"),
+                            local.get("j"),
+                            description=description,
+                        )
+                    )
+                self._pending = self.trace[-1]
+            elif self._pending is not None and frame.f_lineno == self.transcriber_end:
+                # Past the loop: the last rule wrote its phones
+                self._flush(frame)
+        return self._trace_transcriber
+
+    def _trace_silva(self, frame, event, arg):
+        if event == "line":
+            rules = self.silva.get(frame.f_lineno)
+            if rules:
+                local = frame.f_locals
+                string = local["w"]
+                for stage, name, description in rules:
+                    self.trace.append(
+                        _event(
+                            stage,
+                            name,
+                            local.get("p0"),
+                            string=string,
+                            description=description,
+                        )
+                    )
+        return self._trace_silva
+
+    def _trace_case(self, frame, event, arg):
+        if event == "return":
+            # The cases return p0 alone (case6) or (cuts, p0, ...)
+            p0 = arg if not isinstance(arg, tuple) else arg[1]
+            local = frame.f_locals
+            string = local["cuts"].text() if "cuts" in local else local["w"]
+            self.trace.append(
+                _event("case", self.cases[frame.f_code], p0, string=string)
+            )
+        return self._trace_case
+
+    def _trace_stress(self, frame, event, arg):
+        if event == "return" and arg is not None:
+            match = frame.f_locals.get("match")
+            if arg == -1:
+                rule = "none"
+            elif match is not None and match.re is SUFFIXES:
+                # Suffix rules, e.g. group "r9" -> "Rule 9"
+                rule = "Rule " + match.lastgroup[1:]
+            else:
+                rule = _section(self.stress, frame.f_lineno) or "none"
+            self.trace.append(
+                _event("stress", rule, arg, string=frame.f_locals.get("word"))
+            )
+        return self._trace_stress
+
+    def _trace_prefix(self, frame, event, arg):
+        if event == "return" and arg is not None:
+            i, j, _, syllables, w = arg
+            if i > 0:
+                # The phones of the prefix, unless an override replaced them
+                phones = frame.f_locals["match"][1][0]
+                rule = "override" if frame.f_locals["phones"] != phones else "prefix"
+                self.trace.append(
+                    _event("prefix", rule, i, j, w, syllables[:i] + " -> " + w[:j])
+                )
+        return self._trace_prefix
+
+
+def explain(word, algorithm="silva"):
+    """
+    Transcribe a word, recording the rules it goes through, in order.
+
+    Args:
+        word: Input word, e.g. "chocolate"
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    Returns: Dictionary as returned by transcribe_many, plus a "trace": list
+        of dictionaries with the "stage" ("stress", "silva", "case",
+        "prefix" or "transcriber"), the "rule" (e.g. "Rule 7", "case3",
+        "c.5"), the "input" and "output" offsets (e.g. i and j in the
+        transcriber), the "string" after the rule (the word with the
+        boundaries so far for the Silva rules and cases, the phones for the
+        transcriber) and the "description" of the rule
+
+    """
+    word = normalize_word(word)
+    tracer = _Tracer()
+    previous = sys.gettrace()
+    sys.settrace(tracer)
+    try:
+        g2p = G2PTranscriber(word, algorithm=algorithm)
+        homograph = get_homographs_heterophones().get(word)
+        if homograph:
+            tracer.trace.append(
+                _event("transcriber", "homograph", string=homograph.replace("|", ", "))
+            )
+        result = OrderedDict(
+            [
+                ("word", word),
+                ("transcription", g2p.transcriber()),
+                ("syllables", g2p.syllables),
+                ("stress_syllables", g2p.get_syllables_with_stress_boundaries()),
+            ]
+        )
+    finally:
+        sys.settrace(previous)
+    result["trace"] = tracer.trace
+
+    return result
+
+
+def format_trace(trace):
+    """
+    Returns a trace as aligned text lines, e.g.
+        "transcriber  c.5       3   2  ʃo-  Quando for seguida de h"
+
+    """
+    return [
+        "{0:<12} {1:<16} {2:>4} {3:>4}  {4:<24} {5}".format(
+            event["stage"],
+            event["rule"],
+            "" if event["input"] is None else event["input"],
+            "" if event["output"] is None else event["output"],
+            event["string"] or "",
+            event["description"],
+        ).rstrip()
+        for event in trace
+    ]
@@ -22,14 +22,14 @@
 
 from __future__ import unicode_literals
 
-from .utils import load_prefixes, load_homographs_heterophones
+from .utils import load_prefixes, load_prefix_overrides, load_prefix_trie
+from .utils import load_homographs_heterophones
+from .index import SyllableIndex
 
 from stress.tonic import StressDetector
 
-from syllables.silva2011 import Silva2011SyllableSeparator
-from syllables.ceci import CECISyllableSeparator
+from collections import OrderedDict
 
-import re
 import os
 import sys
 
@@ -42,11 +42,73 @@ PATH_HOMOGRAPHS_HETEROPHONES = (
     os.path.dirname(__file__) + "/resources/homographs_heterophones.txt"
 )
 
-# Load prefixes with their phonemes
-PREFIXES = load_prefixes(PATH_PREFIXES)
+# Resources, loaded on first use
+_resources = {}
+
+
+def get_resource(path, loader):
+    """
+    Returns a resource, loading it on first use.
+
+    Args:
+        path: Resource file path, e.g. PATH_PREFIXES
+        loader: Function parsing the resource file, e.g. load_prefixes
+
+    Returns: The parsed resource, as returned by loader
+
+    """
+    key = (path, loader.__name__)
+    if key not in _resources:
+        _resources[key] = loader(path)
+
+    return _resources[key]
+
+
+def get_prefixes():
+    """
+    Returns the prefixes with their phonemes, e.g. [("crip-to", "kɾipɪ-to")]
+
+    """
+    return get_resource(PATH_PREFIXES, load_prefixes)
+
+
+def get_prefix_overrides():
+    """
+    Returns the words whose phonemes of a prefix differ, with these phonemes,
+    e.g. [("te-le", "te-le", "te-le-fo-ne*")]
+
+    """
+    return get_resource(PATH_PREFIXES, load_prefix_overrides)
+
+
+def get_prefix_trie():
+    """
+    Returns the prefixes compiled into a trie (see load_prefix_trie)
+
+    """
+    return get_resource(PATH_PREFIXES, load_prefix_trie)
+
+
+def get_homographs_heterophones():
+    """
+    Returns the phonemes of the Homographs Heterophones (HHs), e.g.
+    {"molho": "ˈmo.ʎʊ|ˈmɔ.ʎʊ"}
+
+    """
+    return get_resource(PATH_HOMOGRAPHS_HETEROPHONES, load_homographs_heterophones)
+
+
+def __getattr__(name):
+    # PREFIXES, PREFIX_OVERRIDES and HHs are still available as module
+    # attributes
+    if name == "PREFIXES":
+        return get_prefixes()
+    if name == "PREFIX_OVERRIDES":
+        return get_prefix_overrides()
+    if name == "HHs":
+        return get_homographs_heterophones()
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
 
-# Load Homographs Heterophones (HHs)
-HHs = load_homographs_heterophones(PATH_HOMOGRAPHS_HETEROPHONES)
 
 # Consonants
 C = [
@@ -84,7 +146,7 @@ class G2PTranscriber(object):
 
     """
 
-    def __init__(self, word, algorithm="silva"):
+    def __init__(self, word, algorithm="silva", store=None, lexicon=None):
         # Initialize word
         try:
             self.word = word.decode("utf-8").lower()
@@ -94,16 +156,77 @@ class G2PTranscriber(object):
         # Initialize stress detector
         self.stress = StressDetector(self.word)
 
-        # Initialize syllable separator
-        if algorithm == "silva":
-            self.separator = Silva2011SyllableSeparator(
-                self.word, self.stress.get_stress_vowel()
+        # Syllable separator, created (importing only the selected one) when
+        # the syllables are first needed
+        self.algorithm = algorithm
+        self._separator = None
+
+        # Persistent cache of the results (SQLiteStore object), optional
+        self.store = store
+
+        # Compiled lexicon looked up before the rules (Lexicon object), optional,
+        # built with the same algorithm
+        if lexicon is not None and lexicon.algorithm != algorithm:
+            raise ValueError(
+                'the lexicon was built with the "%s" algorithm' % lexicon.algorithm
             )
-        else:
-            self.separator = CECISyllableSeparator(self.word)
+        self.lexicon = lexicon
+
+        self._reset()
+
+    def _reset(self):
+        # Products derived from the current word, each one computed when it
+        # is first needed and at most once per word: e.g. a homograph is
+        # looked up without separating its syllables
+        self._syllable_list = None
+        self._syllables = None
+        self._stress_boundaries = None
+        self._phones = None
+        self.index = None
+
+    def set_word(self, word):
+        """
+        Reuse this transcriber, its stress detector and its syllable
+        separator for another word.
+
+        Args:
+            word: Input word, e.g. "chocolate"
 
-        # Initialize syllables
-        self.syllables = self.get_syllables_with_hyphen()
+        """
+        try:
+            self.word = word.decode("utf-8").lower()
+        except:
+            self.word = word.lower()
+
+        # Rebind the word on the stress detector; the syllable separator is
+        # rebound when the syllables are needed
+        self.stress.word = self.word
+        self._reset()
+
+    @property
+    def separator(self):
+        """
+        Syllable separator of the current word, Silva2011SyllableSeparator or
+        CECISyllableSeparator
+
+        """
+        if self._separator is None:
+            if self.algorithm == "silva":
+                from syllables.silva2011 import Silva2011SyllableSeparator
+
+                self._separator = Silva2011SyllableSeparator(
+                    self.word, self.stress.get_stress_vowel()
+                )
+            else:
+                from syllables.ceci import CECISyllableSeparator
+
+                self._separator = CECISyllableSeparator(self.word)
+        elif self._separator.word != self.word:
+            self._separator.word = self.word
+            if self.algorithm == "silva":
+                self._separator.stress = self.stress.get_stress_vowel()
+
+        return self._separator
 
     def get_syllables(self):
         """
@@ -112,10 +235,25 @@ class G2PTranscriber(object):
         Returns: List of syllables, e.g. ['cho', 'co', 'la', 'te']
 
         """
-        try:
-            return self.separator.separate()
-        except (ValueError, IndexError):
-            return [self.word]
+        if self._syllable_list is None:
+            try:
+                self._syllable_list = self.separator.separate()
+            except (ValueError, IndexError):
+                self._syllable_list = [self.word]
+
+        return list(self._syllable_list)
+
+    @property
+    def syllables(self):
+        """
+        Syllables with hyphen, e.g. "cho-co-la-te"
+
+        """
+        if self._syllables is None:
+            self.get_syllables()
+            self._syllables = ("-").join(self._syllable_list)
+
+        return self._syllables
 
     def get_syllables_with_hyphen(self):
         """
@@ -124,7 +262,22 @@ class G2PTranscriber(object):
         Returns: syllables, e.g, "cho-co-la-te"
 
         """
-        return ("-").join(self.get_syllables())
+        return self.syllables
+
+    def get_syllable_index(self):
+        """
+        Returns the syllable boundaries, computed once per word
+
+        Returns: SyllableIndex object
+
+        """
+        if self.index is None:
+            self.index = SyllableIndex(
+                self.syllables,
+                self.stress.get_stress_syllable_with_hyphen(self.syllables),
+            )
+
+        return self.index
 
     def get_syllables_with_stress_boundaries(self):
         """
@@ -133,20 +286,43 @@ class G2PTranscriber(object):
         Returns: syllables with stress boundaries, e.g "cho-co-[la]-te"
 
         """
-        a, b = self.stress.get_stress_syllable_with_hyphen(self.syllables)
+        if self._stress_boundaries is None:
+            index = self.get_syllable_index()
+            a, b = index.tonic_start, index.tonic_end
+            self._stress_boundaries = "{0}[{1}]{2}".format(
+                self.syllables[:a], self.syllables[a:b], self.syllables[b:]
+            )
 
-        return "{0}[{1}]{2}".format(
-            self.syllables[:a], self.syllables[a:b], self.syllables[b:]
-        )
+        return self._stress_boundaries
+
+    def count_syllables(self):
+        """
+        Returns the number of syllables, without the phonetic rules. CECI
+        counts them without building the syllables.
+
+        Returns: Number of syllables, e.g. 4
+
+        """
+        # The words starting with a crasis are counted from their syllables:
+        # separate() fails on them where no_syllables does not
+        if (
+            self._syllable_list is None
+            and self.algorithm == "ceci"
+            and not self.word.startswith("à")
+        ):
+            try:
+                return self.separator.no_syllables(self.word)
+            except (ValueError, IndexError):
+                # As get_syllables, the word is a single syllable
+                return 1
+
+        return len(self.get_syllables())
 
     def is_tonic_syllable(self, a, b, i):
         return True if a <= i and i <= b else False
 
     def is_last_syllable(self, i):
-        mth = [m.start() for m in re.finditer("-", self.syllables)]
-        a, b = mth[-1] if mth else 0, len(self.syllables) - 1
-
-        return True if a <= i and i <= b else False
+        return self.get_syllable_index().is_last(i)
 
     def is_oxytone(self, ts1, ts2, i):
         return (
@@ -157,18 +333,25 @@ class G2PTranscriber(object):
 
     def pre_transcriber(self):
         i, j, tam, w = 0, 0, len(self.syllables), self.syllables
-        for prefix, phones in PREFIXES:
-            if self.syllables.find(prefix) == 0:
-                if self.syllables in ["e-co-cha-to", "e-co-rre-no-va-ção"]:
-                    phones = "ɛ-ko"
-                elif self.syllables in ["e-le-tro-do", "e-le-trô-ni-co"]:
-                    phones = "e-le-tɾo"
-                elif self.syllables.find("te-le-fo-ne") == 0:
-                    phones = "te-le"
-                i, j = len(prefix), len(phones)
-                w = phones + w[i:]
-
-                return i, j, tam, self.syllables, w
+        # Longest prefix of the syllables, in one pass over the trie
+        node, match = get_prefix_trie(), None
+        for k, ch in enumerate(self.syllables):
+            node = node.get(ch)
+            if node is None:
+                break
+            if "" in node:
+                match = k + 1, node[""]
+        if match:
+            i, (phones, overrides) = match
+            for word, startswith, override in overrides:
+                if self.syllables == word or (
+                    startswith and self.syllables.startswith(word)
+                ):
+                    phones = override
+                    break
+            j = len(phones)
+            w = phones + w[i:]
+
         return i, j, tam, self.syllables, w
 
     def transcriber(self):
@@ -181,15 +364,37 @@ class G2PTranscriber(object):
         Returns: Phonemes, e.g. ʃo.ko.ˈla.ʧɪ
 
         """
-        # Verify if the word is a Homograph Heterophone (HH)
+        # Transcribed once per word
+        if self._phones is not None:
+            return self._phones
+
+        # Verify if the word is a Homograph Heterophone (HH), without
+        # separating its syllables
+        HHs = get_homographs_heterophones()
         if HHs.get(self.word):
-            return HHs.get(self.word).replace("|", ", ")
+            self._phones = HHs.get(self.word).replace("|", ", ")
+            return self._phones
+
+        # Verify if the word is in the compiled lexicon
+        if self.lexicon is not None:
+            result = self.lexicon.get(self.word)
+            if result is not None:
+                self._phones = result["transcription"]
+                return self._phones
+
+        # Verify if the word is in the persistent cache
+        if self.store is not None:
+            result = self.store.get(self.word, self.algorithm)
+            if result is not None:
+                self._phones = result["transcription"]
+                return self._phones
 
         # Initialize variables
         i, j, tam, word, w = self.pre_transcriber()
 
-        # Get stress syllable boundaries
-        ts1, ts2 = self.stress.get_stress_syllable_with_hyphen(self.syllables)
+        # Get syllable and stress syllable boundaries
+        index = self.get_syllable_index()
+        ts1, ts2 = index.tonic_start, index.tonic_end
 
         # TODO Translate commentaries from Portuguese to English
 
@@ -220,7 +425,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] == "s"
-                    and self.is_tonic_syllable(ts1, ts2, i + 2)
+                    and index.is_tonic(i + 2)
                 ):
                     ipa = unichr(int("026A", 16))
                     w = w[: j + 1] + ipa + "-" + "s" + w[j + 3 :]
@@ -231,7 +436,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T
-                    and not self.is_tonic_syllable(ts1, ts2, i + 2)
+                    and not index.is_tonic(i + 2)
                 ):
                     ipa = unichr(int("026A", 16))
                     w = w[: j + 1] + ipa + "-" + w[j + 2 :]
@@ -808,7 +1013,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     # w = w[:j] + 'ã' + w[j + 1:]
                     w = w[:j] + "ɐ͂" + w[j + 1 :]
@@ -830,7 +1035,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "ɐ͂" + w[j + 1 :]
                     j += 1
@@ -912,7 +1117,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "ɐ͂" + w[j + 1 :]
                     j += 1
@@ -934,7 +1139,7 @@ class G2PTranscriber(object):
                     i += 1
                     j += 1
                 # Quando estiver em sílaba tônica
-                elif self.is_tonic_syllable(ts1, ts2, i):
+                elif index.is_tonic(i):
                     w = w[:j] + "ɐ͂" + w[j + 1 :]
                     j += 1
 
@@ -996,7 +1201,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "ẽ" + w[j + 1 :]
                     j += 1
@@ -1032,7 +1237,7 @@ class G2PTranscriber(object):
                 # (palavras oxítonas)
                 elif (
                     tam - 1 > i
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                     and word[i + 1] == "l"
                     and len(word) - 2 == i
                 ):
@@ -1051,20 +1256,20 @@ class G2PTranscriber(object):
                 # Quando for tônica e for seguida por 'l' na mesma sílaba
                 elif (
                     tam - 1 > i
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                     and word[i + 1] == "l"
                 ):
                     ipa = unichr(int("025B", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Quando for pronome feminino e vogal tônica
-                elif word in T and self.is_tonic_syllable(ts1, ts2, i):
+                elif word in T and index.is_tonic(i):
                     ipa = unichr(int("025B", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Quando for vogal tônica e a seguinte silaba for 'la, lo', excepto
                 # nas palavras 'pelo, pela'
                 elif (
                     tam - 3 > i
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                     and word[i + 1] == "-"
                     and word[i + 2 : i + 4] in ["la", "lo"]
                     and not word in ["pe-lo", "pe-la"]
@@ -1197,7 +1402,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "ĩ" + w[j + 1 :]
                     j += 1
@@ -1276,7 +1481,7 @@ class G2PTranscriber(object):
                 # -----------------------------------------------------------------
                 # -----------------------------------------------------------------
                 # Quando for final de palavra e for atono
-                elif tam - 1 == i and not self.is_tonic_syllable(ts1, ts2, i):
+                elif tam - 1 == i and not index.is_tonic(i):
                     ipa = unichr(int("026A", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Caso contrario fica com 'i'
@@ -1327,7 +1532,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "õ" + w[j + 1 :]
                     j += 1
@@ -1350,7 +1555,7 @@ class G2PTranscriber(object):
                 # (palavras oxítonas)
                 elif (
                     tam - 2 == i
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                     and word[i + 1] == "l"
                 ):
                     ipa = unichr(int("0254", 16)) + unichr(int("028A", 16))
@@ -1442,7 +1647,7 @@ class G2PTranscriber(object):
                     ipa = unichr(int("0254", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Quando for vogal atona em final da palavra
-                elif tam - 1 == i and not self.is_tonic_syllable(ts1, ts2, i):
+                elif tam - 1 == i and not index.is_tonic(i):
                     ipa = unichr(int("028A", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Caso contrario fica com 'o'
@@ -1470,7 +1675,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "õ" + w[j + 1 :]
                     j += 1
@@ -1521,7 +1726,7 @@ class G2PTranscriber(object):
                     tam - 2 > i
                     and word[i + 1] == "-"
                     and word[i + 2] in T1
-                    and self.is_tonic_syllable(ts1, ts2, i)
+                    and index.is_tonic(i)
                 ):
                     w = w[:j] + "ũ" + w[j + 1 :]
                     j += 1
@@ -1537,7 +1742,6 @@ class G2PTranscriber(object):
                     j += 1
                 # Quando for seguido de 'a' e não suceder as consoantes 'c,g,q'
                 elif tam - 1 > i and word[i + 1] == "a" and not word[i - 1] in T:
-                    w = w[: j + 1] + w[j + 1 :]
                     i += 1
                     j += 1
                 # Quando for seguido de 'e' e após as consoantes oclusivas 'c,g,q'
@@ -1548,7 +1752,6 @@ class G2PTranscriber(object):
                     j += 1
                 # Quando for seguido de 'e' e não suceder as consoantes 'c,g,q'
                 elif tam - 1 > i and word[i + 1] == "e" and not word[i - 1] in T:
-                    w = w[: j + 1] + w[j + 1 :]
                     i += 1
                     j += 1
                 # Apenas na palavra 'muito'
@@ -1592,7 +1795,7 @@ class G2PTranscriber(object):
                     tam - 1 > i
                     and tam - 2 == i
                     and word[i + 1] == "s"
-                    and not self.is_tonic_syllable(ts1, ts2, i)
+                    and not index.is_tonic(i)
                 ):
                     ipa = unichr(int("028A", 16))
                     w = w[:j] + ipa + w[j + 1 :]
@@ -1601,9 +1804,7 @@ class G2PTranscriber(object):
                 # -----------------------------------------------------------------
                 # -----------------------------------------------------------------
                 # Quando for silaba átona no final da palavra
-                elif self.is_last_syllable(i) and not self.is_tonic_syllable(
-                    ts1, ts2, i
-                ):
+                elif index.is_last(i) and not index.is_tonic(i):
                     ipa = unichr(int("028A", 16))
                     w = w[:j] + ipa + w[j + 1 :]
                 # Na sequência 'k, g' + 'u' + vogal ou se for ditongo
@@ -1706,4 +1907,277 @@ class G2PTranscriber(object):
         # Get stress phonetic syllable boundaries
         a, b = self.stress.get_stress_phonetic_syllable(self.syllables, w)
 
-        return (w[:a] + "ˈ" + w[a:]).replace("-", ".")
+        w = (w[:a] + "ˈ" + w[a:]).replace("-", ".")
+
+        if self.store is not None:
+            self.store.put(
+                self.word,
+                self.algorithm,
+                {
+                    "word": self.word,
+                    "transcription": w,
+                    "syllables": self.syllables,
+                    "stress_syllables": self.get_syllables_with_stress_boundaries(),
+                },
+            )
+        self._phones = w
+
+        return w
+
+
+def normalize_word(word):
+    """
+    Returns the word as the transcriber sees it, i.e. decoded and lowercased.
+
+    Args:
+        word: Input word, e.g. "Guerra"
+
+    Returns: Normalized word, e.g. "guerra"
+
+    """
+    try:
+        return word.decode("utf-8").lower()
+    except:
+        return word.lower()
+
+
+def preload(algorithm="silva"):
+    """
+    Load the resources and the syllable separator before the first word,
+    e.g. before starting worker processes.
+
+    Args:
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    """
+    get_prefix_trie()
+    get_homographs_heterophones()
+    G2PTranscriber("a", algorithm=algorithm).get_syllables()
+
+
+def transcribe_many(
+    words, algorithm="silva", cache=None, store=None, lexicon=None, dedup=False
+):
+    """
+    Transcribe a batch of words sharing a single G2P transcriber.
+
+    Args:
+        words: Iterable of input words, e.g. ["guerra", "molho"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        cache: Optional LRUCache object, the words found in it are not
+            transcribed again
+        store: Optional SQLiteStore object, looked up once for the whole
+            batch; the new results are added to it
+        lexicon: Optional Lexicon object built with the same algorithm, its
+            words are not transcribed
+        dedup: Transcribe every distinct word once and copy its result to
+            the other occurrences
+
+    Returns: List of dictionaries, one per word, e.g.
+        {"word": "guerra", "transcription": "ˈge.xa",
+         "syllables": "gue-rra", "stress_syllables": "[gue]-rra"}
+
+    """
+    if lexicon is not None and lexicon.algorithm != algorithm:
+        raise ValueError(
+            'the lexicon was built with the "%s" algorithm' % lexicon.algorithm
+        )
+    if dedup:
+        words = [normalize_word(word) for word in words]
+        unique = transcribe_many(
+            list(OrderedDict.fromkeys(words)), algorithm, cache, store, lexicon
+        )
+        unique = dict((result["word"], result) for result in unique)
+        return [dict(unique[word]) for word in words]
+
+    if cache is not None or store is not None or lexicon is not None:
+        words = [normalize_word(word) for word in words]
+    stored = {}
+    if store is not None:
+        stored = store.get_many(
+            [w for w in words if lexicon is None or w not in lexicon], algorithm
+        )
+
+    g2p, results, new = None, [], []
+    for word in words:
+        result = None if lexicon is None else lexicon.get(word)
+        if result is None and cache is not None:
+            result = cache.get(word, algorithm)
+        if result is not None:
+            results.append(result)
+            continue
+        if word in stored:
+            result = dict(stored[word])
+        else:
+            if g2p is None:
+                g2p = G2PTranscriber(word, algorithm=algorithm)
+            else:
+                g2p.set_word(word)
+            result = {
+                "word": g2p.word,
+                "transcription": g2p.transcriber(),
+                "syllables": g2p.syllables,
+                "stress_syllables": g2p.get_syllables_with_stress_boundaries(),
+            }
+            if store is not None:
+                stored[word] = dict(result)
+                new.append(result)
+        if cache is not None:
+            cache.put(word, algorithm, result)
+        results.append(result)
+
+    if new:
+        store.put_many(new, algorithm)
+        store.commit()
+
+    return results
+
+
+def count_words(words):
+    """
+    Count the occurrences of the words, once normalized.
+
+    Args:
+        words: Iterable of input words, e.g. ["casa", "Casa", "guerra"]
+
+    Returns: OrderedDict from word to frequency, in order of first
+        occurrence, e.g. {"casa": 2, "guerra": 1}
+
+    """
+    counts = OrderedDict()
+    for word in words:
+        word = normalize_word(word)
+        counts[word] = counts.get(word, 0) + 1
+
+    return counts
+
+
+def transcribe_frequencies(words, algorithm="silva", transcribe=None, **kwargs):
+    """
+    Transcribe every distinct word once, with its frequency.
+
+    Args:
+        words: Iterable of input words, e.g. ["casa", "Casa", "guerra"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        transcribe: Function transcribing the distinct words, called as
+            transcribe(words, algorithm, **kwargs), e.g. transcribe_iter or
+            transcribe_parallel; by default transcribe_many
+        kwargs: Arguments of transcribe, e.g. cache, store and lexicon
+
+    Returns: List of dictionaries as returned by transcribe_many, with the
+        "frequency" of the word, from the most frequent word
+
+    """
+    counts = count_words(words)
+    transcribe = transcribe or transcribe_many
+    results = list(transcribe(list(counts), algorithm, **kwargs))
+    for result in results:
+        result["frequency"] = counts[result["word"]]
+    # sorted is stable, so the ties keep the order of first occurrence
+    return sorted(results, key=lambda result: -result["frequency"])
+
+
+def transcribe_iter(words, algorithm="silva", chunk=1000, **kwargs):
+    """
+    Transcribe a stream of words chunk by chunk, so that only a chunk of
+    words and results is in memory at a time.
+
+    Args:
+        words: Iterable of input words, e.g. a file object
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        chunk: Number of words transcribed at a time
+        kwargs: cache, store and lexicon, as in transcribe_many
+
+    Returns: Generator of dictionaries, as returned by transcribe_many
+
+    """
+    batch = []
+    for word in words:
+        batch.append(word)
+        if len(batch) == chunk:
+            for result in transcribe_many(batch, algorithm, **kwargs):
+                yield result
+            batch = []
+    for result in transcribe_many(batch, algorithm, **kwargs):
+        yield result
+
+
+# Fast paths, which skip the phonetic rules: mode -> key of their output
+MODES = OrderedDict(
+    [("count", "count"), ("syllables", "syllables"), ("stress", "stress_syllables")]
+)
+
+
+def analyze_iter(words, algorithm="silva", mode="syllables"):
+    """
+    Count the syllables, separate them or find the stress syllable of a
+    stream of words, with a single G2P transcriber and without the phonetic
+    rules.
+
+    Args:
+        words: Iterable of input words, e.g. a file object
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        mode: "count", "syllables" or "stress"
+
+    Returns: Generator of dictionaries, one per word, e.g. for each mode
+        {"word": "chocolate", "count": 4},
+        {"word": "chocolate", "syllables": "cho-co-la-te"},
+        {"word": "chocolate", "stress_syllables": "cho-co-[la]-te"}
+
+    """
+    if mode not in MODES:
+        raise ValueError('unknown mode "%s"' % mode)
+
+    return _analyze(words, algorithm, mode)
+
+
+def _analyze(words, algorithm, mode):
+    g2p = None
+    for word in words:
+        if g2p is None:
+            g2p = G2PTranscriber(word, algorithm=algorithm)
+        else:
+            g2p.set_word(word)
+        if mode == "count":
+            yield {"word": g2p.word, "count": g2p.count_syllables()}
+        elif mode == "syllables":
+            yield {"word": g2p.word, "syllables": g2p.syllables}
+        else:
+            yield {
+                "word": g2p.word,
+                "stress_syllables": g2p.get_syllables_with_stress_boundaries(),
+            }
+
+
+def count_many(words, algorithm="silva"):
+    """
+    Count the syllables of a batch of words, as analyze_iter(..., "count")
+
+    Returns: List of dictionaries, e.g. {"word": "chocolate", "count": 4}
+
+    """
+    return list(analyze_iter(words, algorithm, "count"))
+
+
+def syllabify_many(words, algorithm="silva"):
+    """
+    Separate the syllables of a batch of words, as
+    analyze_iter(..., "syllables")
+
+    Returns: List of dictionaries, e.g.
+        {"word": "chocolate", "syllables": "cho-co-la-te"}
+
+    """
+    return list(analyze_iter(words, algorithm, "syllables"))
+
+
+def stress_many(words, algorithm="silva"):
+    """
+    Find the stress syllable of a batch of words, as
+    analyze_iter(..., "stress")
+
+    Returns: List of dictionaries, e.g.
+        {"word": "chocolate", "stress_syllables": "cho-co-[la]-te"}
+
+    """
+    return list(analyze_iter(words, algorithm, "stress"))
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# index.py - Syllable boundaries of a word, computed once per word
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+
+class SyllableIndex(object):
+    """
+    Syllable boundaries, last syllable span and tonic syllable span of a
+    word separated by hyphens, e.g. "cho-co-la-te".
+
+    """
+
+    def __init__(self, syllables, tonic):
+        """
+        Args:
+            syllables: Word syllables with hyphen, e.g. "cho-co-la-te"
+            tonic: Stress syllable positions, e.g. (6, 8) -> 'la'
+
+        """
+        # Hyphen positions, e.g. [3, 6, 9]
+        self.boundaries = [k for k, ch in enumerate(syllables) if ch == "-"]
+        # Last syllable span, e.g. (9, 11)
+        self.last_start = self.boundaries[-1] if self.boundaries else 0
+        self.last_end = len(syllables) - 1
+        # Tonic syllable span, e.g. (6, 8)
+        self.tonic_start, self.tonic_end = tonic
+
+    def is_tonic(self, i):
+        return self.tonic_start <= i <= self.tonic_end
+
+    def is_last(self, i):
+        return self.last_start <= i <= self.last_end
+
+    def is_oxytone(self, i):
+        return self.is_tonic(i) and self.is_last(i)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# lexicon.py - Compiled pronunciation lexicon, read through mmap
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# File layout (little-endian):
+#
+#   header   magic, format version, number of words, algorithm, fingerprint
+#   offsets  number of words + 1 unsigned ints, start of every record
+#   records  "word\0transcription\0syllables\0stress syllables" in UTF-8,
+#            sorted by the UTF-8 bytes of the word
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+import codecs
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"PTLX"
+
+VERSION = 1
+
+HEADER = struct.Struct("<4sII8s40s")
+
+OFFSET = struct.Struct("<I")
+
+
+class Lexicon(object):
+    """
+    Read-only pronunciation lexicon built by build_lexicon(). The file is
+    memory-mapped, so opening it costs almost nothing and the pages are
+    shared between processes; a word is found by binary search.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError('"%s" is not a lexicon file!' % path)
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, algorithm, fingerprint = HEADER.unpack_from(self._mm)
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or len(self._mm) < HEADER.size + OFFSET.size * (count + 1)
+        ):
+            self._mm.close()
+            raise ValueError('"%s" is not a lexicon file!' % path)
+        self.count = count
+        self.algorithm = algorithm.rstrip(b"\0").decode("ascii")
+        self.fingerprint = fingerprint.decode("ascii")
+        self._data = HEADER.size + OFFSET.size * (count + 1)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        return self._find(word) >= 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _span(self, i):
+        start = OFFSET.unpack_from(self._mm, HEADER.size + OFFSET.size * i)[0]
+        end = OFFSET.unpack_from(self._mm, HEADER.size + OFFSET.size * (i + 1))[0]
+        return self._data + start, self._data + end
+
+    def _find(self, word):
+        key, lo, hi = word.encode("utf-8"), 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = self._span(mid)
+            k = self._mm[start : self._mm.find(b"\0", start, end)]
+            if k < key:
+                lo = mid + 1
+            elif k > key:
+                hi = mid
+            else:
+                return mid
+
+        return -1
+
+    def get(self, word):
+        """
+        Returns the entry of a word.
+
+        Args:
+            word: Normalized word, e.g. "guerra"
+
+        Returns: Dictionary as returned by transcribe_many, or None if the
+            word is not in the lexicon
+
+        """
+        i = self._find(word)
+        if i < 0:
+            return None
+        start, end = self._span(i)
+        word, transcription, syllables, stress_syllables = (
+            self._mm[start:end].decode("utf-8").split("\0")
+        )
+
+        return {
+            "word": word,
+            "transcription": transcription,
+            "syllables": syllables,
+            "stress_syllables": stress_syllables,
+        }
+
+    def is_current(self):
+        """
+        Returns True if the lexicon was built with the current rules and
+        resources.
+
+        """
+        from .store import get_fingerprint
+
+        return self.fingerprint == get_fingerprint()
+
+    def close(self):
+        self._mm.close()
+
+
+def check_lexicon(path, algorithm=None):
+    """
+    Warn on stderr if a lexicon was built with other rules or resources: it
+    would return the results of that version.
+
+    Args:
+        path: Path of the compiled lexicon
+        algorithm: Algorithm the lexicon must be built with, or None for any
+
+    Returns: True if the lexicon is current
+
+    Raises: ValueError if the file is not a lexicon or was built with another
+        algorithm, IOError if it cannot be read
+
+    """
+    with Lexicon(path) as lexicon:
+        if algorithm is not None and lexicon.algorithm != algorithm:
+            raise ValueError(
+                '"%s" was built with the "%s" algorithm, not "%s"'
+                % (path, lexicon.algorithm, algorithm)
+            )
+        current = lexicon.is_current()
+    if not current:
+        sys.stderr.write(
+            'warning: the lexicon "%s" was built with other rules or resources, '
+            "rebuild it (python -m g2p.lexicon)\n" % path
+        )
+
+    return current
+
+
+def build_lexicon(words, path, algorithm="silva"):
+    """
+    Transcribe a list of words and write them as a lexicon file. The words
+    the rules cannot transcribe are left out, so they raise as before.
+
+    Args:
+        words: Iterable of input words, e.g. ["guerra", "molho"]
+        path: Output file path, replaced atomically
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    Returns: Number of words in the lexicon
+
+    """
+    from .g2p import G2PTranscriber, normalize_word
+    from .record import Transcription
+    from .store import get_fingerprint
+
+    entries, g2p = {}, None
+    for word in words:
+        word = normalize_word(word)
+        if not word or "\0" in word or word in entries:
+            continue
+        try:
+            if g2p is None:
+                g2p = G2PTranscriber(word, algorithm=algorithm)
+            else:
+                g2p.set_word(word)
+            # Records share their syllables: the strings are formatted again
+            # one word at a time, when written
+            entries[word] = Transcription.from_strings(
+                word,
+                g2p.transcriber(),
+                g2p.syllables,
+                g2p.get_syllables_with_stress_boundaries(),
+            )
+        except (IndexError, ValueError):
+            continue
+
+    keys = sorted(entries, key=lambda w: w.encode("utf-8"))
+    records, offsets = [], [0]
+    for word in keys:
+        entry = entries.pop(word)
+        records.append(
+            "\0".join(
+                (
+                    word,
+                    entry.get_transcription(),
+                    entry.get_syllables_with_hyphen(),
+                    entry.get_syllables_with_stress_boundaries(),
+                )
+            ).encode("utf-8")
+        )
+        offsets.append(offsets[-1] + len(records[-1]))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(keys),
+                algorithm.encode("ascii"),
+                get_fingerprint().encode("ascii"),
+            )
+        )
+        f.write(struct.pack("<%dI" % len(offsets), *offsets))
+        f.write(b"".join(records))
+    # Processes reading the old file keep their mapping
+    getattr(os, "replace", os.rename)(tmp, path)
+
+    return len(keys)
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(description="Build a compiled lexicon file")
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        required=True,
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-f", "--file", dest="file", required=True, help="Word list, one per line"
+    )
+    parser.add_argument(
+        "-o", "--output", dest="output", required=True, help="Lexicon file"
+    )
+    args = parser.parse_args()
+
+    with codecs.open(args.file, "r", "utf-8") as f:
+        n = build_lexicon((line.strip() for line in f), args.output, args.separator)
+
+    print('\n{0} words written to "{1}".\n'.format(n, args.output))
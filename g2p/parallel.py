@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# parallel.py - Transcribe a stream of words in a pool of processes
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from collections import deque
+
+from .g2p import transcribe_many, normalize_word, preload
+from .cache import LRUCache
+from .lexicon import Lexicon
+
+import multiprocessing
+
+# State of a worker process, set by _init_worker
+_worker = {}
+
+
+def _init_worker(algorithm, cache, lexicon, dedup):
+    # Load the resources once per worker
+    preload(algorithm)
+    _worker["algorithm"] = algorithm
+    _worker["cache"] = LRUCache(cache) if cache else None
+    _worker["lexicon"] = Lexicon(lexicon) if lexicon else None
+    _worker["dedup"] = dedup
+
+
+def _transcribe_chunk(words):
+    return transcribe_many(
+        words,
+        _worker["algorithm"],
+        cache=_worker["cache"],
+        lexicon=_worker["lexicon"],
+        dedup=_worker["dedup"],
+    )
+
+
+def _chunks(words, chunk):
+    batch = []
+    for word in words:
+        batch.append(word)
+        if len(batch) == chunk:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def transcribe_parallel(
+    words,
+    algorithm="silva",
+    workers=None,
+    chunk=1000,
+    cache=0,
+    store=None,
+    lexicon=None,
+    dedup=False,
+):
+    """
+    Transcribe a stream of words in a pool of processes, chunk by chunk.
+    The results come out in the input order, and only a few chunks per
+    worker are in flight at a time, so memory stays bounded.
+
+    Args:
+        words: Iterable of input words, e.g. a file object
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        workers: Number of processes, by default the number of CPUs
+        chunk: Number of words sent to a worker at a time
+        cache: Capacity of the LRUCache of every worker, 0 for none
+        store: Optional SQLiteStore object, used by this process only:
+            the workers only transcribe the words not found in it
+        lexicon: Optional path of a compiled lexicon, mapped by every
+            worker
+        dedup: Transcribe every distinct word of a chunk once
+
+    Returns: Generator of dictionaries, as returned by transcribe_many
+
+    """
+    workers = workers or multiprocessing.cpu_count()
+    # Resources loaded before the fork are shared by the workers
+    preload(algorithm)
+    pool = multiprocessing.Pool(
+        workers, _init_worker, (algorithm, cache, lexicon, dedup)
+    )
+    pending = deque()
+    try:
+        for batch in _chunks(words, chunk):
+            stored, missing = {}, batch
+            if store is not None:
+                batch = [normalize_word(word) for word in batch]
+                stored = store.get_many(batch, algorithm)
+                missing = [word for word in batch if word not in stored]
+            task = pool.apply_async(_transcribe_chunk, (missing,))
+            pending.append((batch, stored, task))
+            if len(pending) >= 2 * workers:
+                for result in _merge(pending.popleft(), store, algorithm):
+                    yield result
+        while pending:
+            for result in _merge(pending.popleft(), store, algorithm):
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _merge(pending, store, algorithm):
+    batch, stored, task = pending
+    results = task.get()
+    if store is None:
+        return results
+
+    new = dict((result["word"], result) for result in results)
+    if new:
+        store.put_many(new.values(), algorithm)
+        store.commit()
+    it = iter(results)
+
+    return [dict(stored[word]) if word in stored else next(it) for word in batch]
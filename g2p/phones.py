@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# phones.py - Phone inventory, phone ids of the transcriptions and padded
+# NumPy batches for training acoustic models (TTS/ASR)
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# A phone is a letter with its diacritics, e.g. "ɐ̃": the nasal diphthong
+# "ɐ͂ʊ̃" is the two phones "ɐ̃" and "ʊ̃". The transcriber writes some nasal
+# vowels precomposed ("õ") and some with the Greek perispomeni ("ɐ͂"), so the
+# transcriptions are decomposed and the perispomeni read as a tilde first.
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from itertools import chain
+
+from .g2p import transcribe_iter
+from .record import STRESS_MARK
+
+import codecs
+import unicodedata
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2: the syllables are encoded every time
+    def lru_cache(maxsize):
+        return lambda function: function
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TILDE = "\u0303"
+
+PERISPOMENI = "\u0342"
+
+PAD, UNK = "<pad>", "<unk>"
+
+# Phones the rules and the resources write; the id of a phone is its index,
+# so that new phones go at the end
+PHONES = (
+    [PAD, UNK]
+    # Vogais orais
+    + "a ɐ e ɛ i ɪ o ɔ u ʊ".split()
+    # Vogais nasais
+    + [vowel + TILDE for vowel in "ɐ e i ɪ o u ʊ".split()]
+    # Consoantes, X being the archiphoneme /R/ of the prefixes and homographs
+    + "p b t d k g f v s z ʃ ʒ ʧ ʤ m n ɲ ŋ ɳ l ʎ ɾ x X ɣ".split()
+)
+
+PHONE_IDS = dict((phone, k) for k, phone in enumerate(PHONES))
+
+PAD_ID, UNK_ID = PHONE_IDS[PAD], PHONE_IDS[UNK]
+
+# Number of phone syllables whose encoding is kept, the most recently used
+SYLLABLES = 10000
+
+
+def canonical(transcription):
+    """
+    Returns a transcription with its diacritics decomposed and every nasal
+    vowel written with a tilde, e.g. "õ" -> "õ", "ɐ͂" -> "ɐ̃"
+
+    """
+    return unicodedata.normalize("NFD", transcription).replace(PERISPOMENI, TILDE)
+
+
+def segment(pronunciation):
+    """
+    Split a pronunciation into phones. The stress mark and the syllable dots
+    are dropped, and so are the spaces and parentheses of the multiword
+    homographs, e.g. "(ʤɪ) ˈboX.kʊ".
+
+    Args:
+        pronunciation: One pronunciation, e.g. "ˈpɐ͂ʊ̃"
+
+    Returns: (phones, stress), stress holding 1 for the phones of the stress
+        syllable, e.g. (["p", "ɐ̃", "ʊ̃"], [1, 1, 1])
+
+    """
+    phones, stress, stressed = [], [], 0
+    for ch in canonical(pronunciation):
+        if ch == STRESS_MARK:
+            stressed = 1
+        elif ch == ".":
+            stressed = 0
+        elif unicodedata.combining(ch):
+            if phones:
+                phones[-1] += ch
+        elif unicodedata.category(ch).startswith("L"):
+            phones.append(ch)
+            stress.append(stressed)
+    return phones, stress
+
+
+@lru_cache(maxsize=SYLLABLES)
+def _encode_syllable(syllable):
+    phones, mask = segment(syllable)
+    return tuple(PHONE_IDS.get(phone, UNK_ID) for phone in phones), tuple(mask)
+
+
+def encode(transcription):
+    """
+    Returns the phone ids of a transcription, with its stress mask. Only the
+    first pronunciation of a homograph is encoded.
+
+    Args:
+        transcription: Transcription, e.g. "ʃo.ko.ˈla.ʧɪ"
+
+    Returns: (ids, stress), e.g. ([29, 8, 23, 8, 38, 2, 31, 7],
+        [0, 0, 0, 0, 1, 1, 0, 0]); the phones outside PHONES, e.g. letters
+        no rule transcribed, get UNK_ID
+
+    """
+    ids, stress = [], []
+    for syllable in transcription.split(", ")[0].split("."):
+        syllable_ids, syllable_stress = _encode_syllable(syllable)
+        ids.extend(syllable_ids)
+        stress.extend(syllable_stress)
+    return ids, stress
+
+
+def pad(encoded, dtype="int32"):
+    """
+    Pack encoded transcriptions into padded arrays (NumPy).
+
+    Args:
+        encoded: List of (ids, stress), as returned by encode
+        dtype: NumPy type of the ids and lengths
+
+    Returns: Dictionary of arrays, n being the number of transcriptions and
+        m the number of phones of the longest one:
+            "ids"      (n, m) phone ids, padded with PAD_ID
+            "lengths"  (n,) number of phones
+            "stress"   (n, m) True for the phones of the stress syllable
+
+    """
+    if numpy is None:
+        raise ImportError("the padded batches need NumPy")
+    n = len(encoded)
+    lengths = numpy.fromiter((len(ids) for ids, _ in encoded), dtype, n)
+    width = int(lengths.max()) if n else 0
+    total = int(lengths.sum())
+    # The phones fill the rows from the left, in the order of the words
+    mask = numpy.arange(width) < lengths[:, None]
+    ids = numpy.full((n, width), PAD_ID, dtype)
+    ids[mask] = numpy.fromiter(chain.from_iterable(i for i, _ in encoded), dtype, total)
+    stress = numpy.zeros((n, width), bool)
+    stress[mask] = numpy.fromiter(
+        chain.from_iterable(s for _, s in encoded), bool, total
+    )
+    return {"ids": ids, "lengths": lengths, "stress": stress}
+
+
+def encode_batch(words, algorithm="silva", dtype="int32", **kwargs):
+    """
+    Transcribe words into padded arrays of phone ids (NumPy).
+
+    Args:
+        words: Iterable of input words, e.g. ["guerra", "molho"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        dtype: NumPy type of the ids and lengths
+        kwargs: cache, store and lexicon, as in transcribe_many
+
+    Returns: Dictionary of arrays, as returned by pad
+
+    """
+    if numpy is None:
+        raise ImportError("the padded batches need NumPy")
+    return pad(
+        [
+            encode(result["transcription"])
+            for result in transcribe_iter(words, algorithm, **kwargs)
+        ],
+        dtype,
+    )
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(description="Encode a word list as phone ids (.npz)")
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument("-f", "--file", dest="file", help="Words, one per line")
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help="Output file, NumPy .npz with ids, lengths, stress and words",
+    )
+    parser.add_argument(
+        "-i",
+        "--inventory",
+        dest="inventory",
+        action="store_true",
+        help="Print the phone inventory (id and phone) and exit",
+    )
+    args = parser.parse_args()
+
+    if args.inventory:
+        for k, phone in enumerate(PHONES):
+            print("{0}\t{1}".format(k, phone))
+    elif not args.file or not args.output:
+        parser.error("-f and -o are required, unless -i")
+    else:
+        with codecs.open(args.file, "r", "utf-8") as f:
+            words = [line.strip() for line in f if line.strip()]
+        batch = encode_batch(words, args.separator)
+        numpy.savez(args.output, words=numpy.array(words), **batch)
+        print(
+            '\n{0} words, {1} phones written to "{2}".\n'.format(
+                len(words), int(batch["lengths"].sum()), args.output
+            )
+        )
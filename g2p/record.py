@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# record.py - Compact transcription records: the syllables and phones of a
+# word as tuples, with formatters to the strings of transcribe_many
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# A record holds no formatted string: the syllables and phone syllables are
+# interned, i.e. shared between the records (a few thousand distinct
+# syllables make up a lexicon), so a record costs an object and two small
+# tuples, instead of a dictionary and three strings. An interned string is
+# freed with the last record holding it.
+
+from __future__ import unicode_literals
+
+from .g2p import transcribe_iter
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 only interns byte strings: the syllables are not shared
+    def intern(string):
+        return string
+
+
+STRESS_MARK = "ˈ"
+
+
+def _share(strings):
+    return tuple(intern(s) for s in strings)
+
+
+def _parse_phones(transcription):
+    """
+    Split a pronunciation into phone syllables and stress index, e.g.
+    "ʃo.ko.ˈla.ʧɪ" -> (("ʃo", "ko", "la", "ʧɪ"), 2); the index is None
+    without a stress mark.
+
+    """
+    phones, stress = transcription.split("."), None
+    for k, phone in enumerate(phones):
+        if phone.startswith(STRESS_MARK):
+            phones[k], stress = phone[len(STRESS_MARK) :], k
+            break
+    return phones, stress
+
+
+def _format_phones(phones, stress):
+    return ".".join(
+        STRESS_MARK + phone if k == stress else phone for k, phone in enumerate(phones)
+    )
+
+
+class Transcription(object):
+    """
+    Transcription of a word, e.g. for "chocolate":
+
+        word          "chocolate"
+        syllables     ("cho", "co", "la", "te")
+        stress        2, index of the stress syllable
+        phones        ("ʃo", "ko", "la", "ʧɪ")
+        phone_stress  2, index of the stress phone syllable (None if unmarked)
+        alternatives  () or, for the heterophonic homographs, every
+                      pronunciation as written in the resource, e.g.
+                      ("ˈmo.ʎʊ", "ˈmɔ.ʎʊ"); phones then hold the first one
+
+    """
+
+    __slots__ = (
+        "word",
+        "syllables",
+        "stress",
+        "phones",
+        "phone_stress",
+        "alternatives",
+    )
+
+    def __init__(
+        self, word, syllables, stress, phones, phone_stress=None, alternatives=()
+    ):
+        self.word = word
+        self.syllables = _share(syllables)
+        self.stress = stress
+        self.phones = _share(phones)
+        self.phone_stress = phone_stress
+        self.alternatives = tuple(alternatives)
+
+    @classmethod
+    def from_strings(cls, word, transcription, syllables, stress_syllables):
+        """
+        Build a record from the strings of the transcriber.
+
+        Args:
+            word: Normalized word, e.g. "chocolate"
+            transcription: Phones, e.g. "ʃo.ko.ˈla.ʧɪ"
+            syllables: Syllables with hyphen, e.g. "cho-co-la-te"
+            stress_syllables: Syllables with the stress syllable between
+                brackets, e.g. "cho-co-[la]-te"
+
+        Returns: Transcription object
+
+        """
+        start = stress_syllables.find("[")
+        stress = stress_syllables[:start].count("-") if start >= 0 else None
+        pronunciations = transcription.split(", ")
+        phones, phone_stress = _parse_phones(pronunciations[0])
+        alternatives = ()
+        if len(pronunciations) > 1 or (
+            _format_phones(phones, phone_stress) != transcription
+        ):
+            # Homographs, written by hand: kept as they are
+            alternatives = pronunciations
+        return cls(
+            word, syllables.split("-"), stress, phones, phone_stress, alternatives
+        )
+
+    @classmethod
+    def from_dict(cls, result):
+        """
+        Build a record from a dictionary as returned by transcribe_many.
+
+        """
+        return cls.from_strings(
+            result["word"],
+            result["transcription"],
+            result["syllables"],
+            result["stress_syllables"],
+        )
+
+    def get_syllables_with_hyphen(self):
+        """
+        Returns syllables with hyphen, e.g. "cho-co-la-te"
+
+        """
+        return "-".join(self.syllables)
+
+    def get_syllables_with_stress_boundaries(self):
+        """
+        Returns syllables with the stress syllable between brackets, e.g.
+        "cho-co-[la]-te"
+
+        """
+        return "-".join(
+            "[" + syllable + "]" if k == self.stress else syllable
+            for k, syllable in enumerate(self.syllables)
+        )
+
+    def get_transcription(self):
+        """
+        Returns the phones, e.g. "ʃo.ko.ˈla.ʧɪ", or the pronunciations of a
+        homograph separated by commas, e.g. "ˈmo.ʎʊ, ˈmɔ.ʎʊ"
+
+        """
+        if self.alternatives:
+            return ", ".join(self.alternatives)
+        return _format_phones(self.phones, self.phone_stress)
+
+    def as_dict(self):
+        """
+        Returns the dictionary transcribe_many returns for the word.
+
+        """
+        return {
+            "word": self.word,
+            "transcription": self.get_transcription(),
+            "syllables": self.get_syllables_with_hyphen(),
+            "stress_syllables": self.get_syllables_with_stress_boundaries(),
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, Transcription) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "Transcription({0!r}, {1!r}, {2!r}, {3!r}, {4!r}, {5!r})".format(
+            *[getattr(self, name) for name in self.__slots__]
+        )
+
+
+def transcribe_records(words, algorithm="silva", chunk=1000, **kwargs):
+    """
+    Transcribe words into records, holding the dictionaries of a chunk of
+    words at a time.
+
+    Args:
+        words: Iterable of input words, e.g. ["guerra", "molho"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        chunk: Number of words transcribed at a time
+        kwargs: cache, store and lexicon, as in transcribe_many
+
+    Returns: List of Transcription objects, one per word
+
+    """
+    return [
+        Transcription.from_dict(result)
+        for result in transcribe_iter(words, algorithm, chunk, **kwargs)
+    ]
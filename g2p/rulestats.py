@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# rulestats.py - Count the rules of the transcriber and of the Silva (2011)
+# syllable separator fired over a run
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# The rules are not instrumented: while a RuleCounter is enabled, a trace
+# function (sys.settrace) watches the lines of G2PTranscriber.transcriber and
+# Silva2011SyllableSeparator.separate, and the calls of the caseN functions.
+# The lines that start each rule are found in the source code, so that the
+# rules run untouched, at full speed, when no counter is enabled.
+#
+# The rules are named after the if/elif chain of the main loop of each
+# function and the if/elif/else chains right inside each of its branches:
+#
+#   transcriber  "p" (letter branch), "p.1" (its first sub-rule), ...
+#   silva        "Rule 3" (from the comment above the branch), "Rule 3.2", ...
+#   case         "case2", and "Rule 3 -> case2" for the rule that called it
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from collections import Counter, OrderedDict
+
+from .g2p import G2PTranscriber, transcribe_many, normalize_word
+
+from syllables import cases
+from syllables.silva2011 import Silva2011SyllableSeparator
+
+import ast
+import codecs
+import dis
+import inspect
+import io
+import json
+import re
+import sys
+
+STAGES = ["transcriber", "silva", "case"]
+
+
+def _comment_above(lines, lineno):
+    """
+    Returns the comment lines right above a line, without the section
+    separators (e.g. "# ----- VOGAIS -----") and the TODOs, joined by spaces
+
+    """
+    comments = []
+    k = lineno - 2
+    while k >= 0 and lines[k].strip().startswith("#"):
+        text = lines[k].strip().lstrip("#").strip()
+        if text and not text.startswith("---") and not text.startswith("TODO"):
+            comments.insert(0, text)
+        k -= 1
+    return " ".join(comments)
+
+
+def _chain(node):
+    """
+    Returns the branches of an if/elif/else chain, as (if node, body), the
+    node being None for the else
+
+    """
+    branches = [(node, node.body)]
+    while node.orelse:
+        first = node.orelse[0]
+        if (
+            len(node.orelse) == 1
+            and isinstance(first, ast.If)
+            and first.col_offset == node.col_offset
+        ):
+            node = first
+            branches.append((node, node.body))
+        else:
+            branches.append((None, node.orelse))
+            break
+    return branches
+
+
+def _describe(lines, node, body):
+    # Comment above the if/elif, or above the first statement of the else
+    if node is not None:
+        return _comment_above(lines, node.lineno)
+    description = _comment_above(lines, body[0].lineno)
+    if not description and lines[body[0].lineno - 2].strip() == "else:":
+        description = _comment_above(lines, body[0].lineno - 1)
+    return description
+
+
+def _first_line(statement, code_lines):
+    """
+    Returns the first line of a statement that holds code: the line events
+    of a multiline test, e.g. "if (\n a == b\n ...)", start at its first
+    operand rather than at the if
+
+    """
+    node = statement.test if isinstance(statement, (ast.If, ast.While)) else statement
+    for line in range(node.lineno, getattr(node, "end_lineno", node.lineno) + 1):
+        if line in code_lines:
+            return line
+    return statement.lineno
+
+
+def _letter(test):
+    # "p" for a test such as word[i] == "p"
+    if (
+        isinstance(test, ast.Compare)
+        and len(test.ops) == 1
+        and isinstance(test.ops[0], ast.Eq)
+        and isinstance(test.comparators[0], ast.Constant)
+        and isinstance(test.comparators[0].value, type(""))
+    ):
+        return test.comparators[0].value
+    return None
+
+
+def rule_lines(function, stage):
+    """
+    Find the rules of a function: the branches of the if/elif chain of its
+    main loop, and the branches of the if/elif/else chains right inside
+    each of them.
+
+    Args:
+        function: Function or method, e.g. G2PTranscriber.transcriber
+        stage: Name of the stage, e.g. "transcriber"
+
+    Returns: Dictionary of line number -> list of (stage, rule, description),
+        the line being the first one run by the rule (a one-line rule shares
+        it with the rule that holds it)
+
+    """
+    code = function.__code__
+    path = inspect.getsourcefile(function)
+    with io.open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    lines = source.splitlines()
+    definition = [
+        node
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.FunctionDef) and node.lineno == code.co_firstlineno
+    ][0]
+    loop = [node for node in ast.walk(definition) if isinstance(node, ast.While)][0]
+    dispatch = [node for node in loop.body if isinstance(node, ast.If)][0]
+
+    code_lines = set(line for _, line in dis.findlinestarts(code))
+    rules = {}
+    for n, (node, body) in enumerate(_chain(dispatch), 1):
+        name = _letter(node.test) if node is not None else "else"
+        description = _describe(lines, node, body)
+        if name is None:
+            # Named after its comment, e.g. "Rule 3:"
+            name = description.rstrip(":") or "branch {0}".format(n)
+            description = ""
+        line = _first_line(body[0], code_lines)
+        rules.setdefault(line, []).append((stage, name, description))
+
+        k = 0
+        for statement in body:
+            if not isinstance(statement, ast.If):
+                continue
+            for sub_node, sub_body in _chain(statement):
+                k += 1
+                line = _first_line(sub_body[0], code_lines)
+                rules.setdefault(line, []).append(
+                    (
+                        stage,
+                        "{0}.{1}".format(name, k),
+                        _describe(lines, sub_node, sub_body),
+                    )
+                )
+
+    return rules
+
+
+class RuleCounter(object):
+    """
+    Count the rules fired in this thread while enabled, e.g.
+
+        counter = RuleCounter()
+        with counter:
+            transcribe_many(words)
+        counter.report()
+
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.rules = {}
+        self._lines = {
+            G2PTranscriber.transcriber.__code__: rule_lines(
+                G2PTranscriber.transcriber, "transcriber"
+            ),
+            Silva2011SyllableSeparator.separate.__code__: rule_lines(
+                Silva2011SyllableSeparator.separate, "silva"
+            ),
+        }
+        for lines in self._lines.values():
+            for line, rules in lines.items():
+                for stage, name, description in rules:
+                    self.rules[(stage, name)] = (line, description)
+        self._cases = dict(
+            (getattr(cases, name).__code__, name)
+            for name in dir(cases)
+            if re.match(r"case\d+$", name)
+        )
+        self._rule = None
+        self._previous = None
+
+    def enable(self):
+        self._previous = sys.gettrace()
+        sys.settrace(self._trace)
+
+    def disable(self):
+        sys.settrace(self._previous)
+        self._previous = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *args):
+        self.disable()
+
+    def clear(self):
+        self.counts.clear()
+
+    def _trace(self, frame, event, arg):
+        # Called at every function call: trace the lines of the rules only
+        lines = self._lines.get(frame.f_code)
+        if lines is not None:
+            counts = self.counts
+
+            def trace_lines(frame, event, arg):
+                if event == "line":
+                    for stage, name, _ in lines.get(frame.f_lineno, ()):
+                        counts[(stage, name)] += 1
+                        if stage == "silva" and "." not in name:
+                            self._rule = name
+                return trace_lines
+
+            return trace_lines
+
+        case = self._cases.get(frame.f_code)
+        if case is not None:
+            self.counts[("case", case)] += 1
+            if self._rule is not None:
+                self.counts[("case", "{0} -> {1}".format(self._rule, case))] += 1
+        return None
+
+    def report(self):
+        """
+        Returns the counts, by stage and by decreasing count.
+
+        Returns: List of dictionaries, e.g. {"stage": "transcriber",
+            "rule": "c.5", "count": 1532, "share": 0.41, "line": 393,
+            "description": "Quando for seguida de h"}, the share being the
+            fraction of the hits of the parent rule (of the stage for the
+            top-level rules and the cases)
+
+        """
+        totals = Counter()
+        for (stage, name), count in self.counts.items():
+            if "." not in name and " -> " not in name:
+                totals[stage] += count
+        rows = []
+        for (stage, name), count in self.counts.items():
+            if "." in name:
+                parent = self.counts[(stage, name.rsplit(".", 1)[0])]
+            elif " -> " in name:
+                parent = self.counts[(stage, name.split(" -> ")[1])]
+            else:
+                parent = totals[stage]
+            line, description = self.rules.get((stage, name), (None, ""))
+            rows.append(
+                OrderedDict(
+                    [
+                        ("stage", stage),
+                        ("rule", name),
+                        ("count", count),
+                        ("share", float(count) / parent if parent else 0.0),
+                        ("line", line),
+                        ("description", description),
+                    ]
+                )
+            )
+        rows.sort(key=lambda r: (STAGES.index(r["stage"]), -r["count"], r["rule"]))
+        return rows
+
+
+def write_report(f, rows):
+    """
+    Write a report as tab-separated values, with a header line.
+
+    Args:
+        f: Output text file
+        rows: Rows as returned by RuleCounter.report
+
+    """
+    f.write("stage\trule\tcount\tshare\tline\tdescription\n")
+    for row in rows:
+        f.write(
+            "{0}\t{1}\t{2}\t{3:.4f}\t{4}\t{5}\n".format(
+                row["stage"],
+                row["rule"],
+                row["count"],
+                row["share"],
+                "" if row["line"] is None else row["line"],
+                row["description"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(description="Count the rules fired over a word list")
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        default="silva",
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-f", "--file", dest="file", required=True, help="Words, one per line"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default=None,
+        help="Report file (default: stdout)",
+    )
+    parser.add_argument(
+        "-j", "--json", dest="json", action="store_true", help="Write JSON"
+    )
+    parser.add_argument(
+        "-u",
+        "--unique",
+        dest="unique",
+        action="store_true",
+        help="Count every distinct word once, instead of every occurrence",
+    )
+    args = parser.parse_args()
+
+    with codecs.open(args.file, "r", "utf-8") as f:
+        words = [normalize_word(line) for line in f if line.strip()]
+    if args.unique:
+        words = list(OrderedDict.fromkeys(words))
+
+    counter = RuleCounter()
+    errors = 0
+    with counter:
+        for word in words:
+            try:
+                transcribe_many([word], args.separator)
+            except (IndexError, ValueError):
+                errors += 1
+
+    rows = counter.report()
+    f = io.open(args.output, "w", encoding="utf-8") if args.output else None
+    out = f if f is not None else sys.stdout
+    if args.json:
+        out.write(json.dumps(rows, indent=2, ensure_ascii=False) + "\n")
+    else:
+        write_report(out, rows)
+    if f is not None:
+        f.close()
+    sys.stderr.write("{0} words, {1} errors\n".format(len(words), errors))
@@ -0,0 +1,471 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# server.py - Local HTTP transcription service, batching the concurrent
+# requests (Python 3)
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+# Endpoints:
+#
+#   GET  /transcribe?word=guerra&algorithm=silva  -> {"word": ..., ...}
+#   POST /transcribe {"words": [...], "algorithm": "silva"}  -> {"results": [...]}
+#   GET  /health  -> {"status": "ok"}
+#   GET  /stats   -> number of requests, words and batches
+#
+# With --prefork N, the parent process loads the resources and the lexicon,
+# then forks N children serving the same socket: the children share the
+# parent's memory copy-on-write, and the lexicon through mmap.
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+from .lexicon import check_lexicon
+from .worker import ALGORITHMS, MAX_WORDS, init_worker, transcribe_batch
+
+import asyncio
+import gc
+import json
+import os
+import signal
+import socket
+
+# Limits of a request: MAX_BODY bytes of body and MAX_WORDS words
+MAX_BODY = 1 << 20
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class MicroBatcher(object):
+    """
+    Coalesce the words of concurrent requests into batches of at most
+    batch_size words, waiting at most max_wait seconds after the first word
+    of a batch. Up to `slots` batches run at a time in the executor.
+
+    """
+
+    def __init__(self, executor, algorithm, batch_size=64, max_wait=0.002, slots=1):
+        self.executor = executor
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(slots)
+        self.batches = 0
+        self.words = 0
+
+    async def transcribe(self, word):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((word, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.batch_size:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self.slots.acquire()
+            asyncio.ensure_future(self._execute(batch))
+
+    async def _execute(self, batch):
+        try:
+            words = [word for word, _ in batch]
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, transcribe_batch, words, self.algorithm
+            )
+            self.batches += 1
+            self.words += len(words)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.slots.release()
+
+
+class TranscriptionService(object):
+    """
+    HTTP/1.1 service (with keep-alive) over transcribe_many, using one
+    MicroBatcher per algorithm.
+
+    """
+
+    def __init__(self, workers=1, batch_size=64, max_wait=0.002, cache=0, lexicon=None):
+        # The words are transcribed in worker processes, or in a thread of
+        # this process if workers is 0 (see init_worker)
+        self.executor = None
+        if workers > 0:
+            self.executor = ProcessPoolExecutor(
+                workers, initializer=init_worker, initargs=(cache, lexicon)
+            )
+        self.batchers = dict(
+            (
+                algorithm,
+                MicroBatcher(
+                    self.executor, algorithm, batch_size, max_wait, max(workers, 1)
+                ),
+            )
+            for algorithm in ALGORITHMS
+        )
+        self.requests = 0
+        self.server = None
+        self._tasks = []
+
+    async def start(self, host="127.0.0.1", port=8000, sock=None):
+        self._tasks = [
+            asyncio.ensure_future(batcher.run()) for batcher in self.batchers.values()
+        ]
+        if sock is not None:
+            # Listening socket inherited from a pre-fork parent
+            self.server = await asyncio.start_server(self._handle, sock=sock)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        for task in self._tasks:
+            task.cancel()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def stats(self):
+        batches = sum(b.batches for b in self.batchers.values())
+        words = sum(b.words for b in self.batchers.values())
+        return {
+            "requests": self.requests,
+            "words": words,
+            "batches": batches,
+            "mean_batch_size": float(words) / batches if batches else 0.0,
+        }
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                keep_alive = await self._respond(line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line, reader, writer):
+        headers, version = {}, "HTTP/1.0"
+        try:
+            try:
+                method, target, version = line.decode("latin-1").split()
+            except ValueError:
+                raise HTTPError(400, "malformed request line")
+            while True:
+                header = await reader.readline()
+                if not header.strip():
+                    break
+                name, _, value = header.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                raise HTTPError(400, "malformed content-length")
+            if length < 0:
+                raise HTTPError(400, "malformed content-length")
+            if length > MAX_BODY:
+                raise HTTPError(413, "request body too large")
+            body = await reader.readexactly(length) if length else b""
+            self.requests += 1
+            status, payload = 200, await self._dispatch(method, target, body)
+        except HTTPError as e:
+            status, payload = e.status, {"error": str(e)}
+        except (asyncio.IncompleteReadError, ConnectionError):
+            raise
+        except Exception:
+            # A failure of this request only, the connection is closed
+            status, payload = 500, {"error": "internal error"}
+
+        # The connection is closed after a malformed request, a body too large
+        # (left unread) or a failure
+        keep_alive = (
+            version == "HTTP/1.1"
+            and headers.get("connection") != "close"
+            and status not in (400, 413, 500)
+        )
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            (
+                "HTTP/1.1 {0} {1}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                "Content-Length: {2}\r\n"
+                "Connection: {3}\r\n\r\n"
+            )
+            .format(
+                status,
+                REASONS[status],
+                len(data),
+                "keep-alive" if keep_alive else "close",
+            )
+            .encode("latin-1")
+            + data
+        )
+
+        return keep_alive
+
+    async def _dispatch(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/health":
+            return {"status": "ok"}
+        if url.path == "/stats":
+            return self.stats()
+        if url.path != "/transcribe":
+            raise HTTPError(404, "unknown path")
+
+        if method == "GET":
+            query = parse_qs(url.query)
+            words = query.get("word", [])
+            algorithm = query.get("algorithm", ["silva"])[0]
+            if len(words) != 1:
+                raise HTTPError(400, "expected one word parameter")
+        elif method == "POST":
+            try:
+                request = json.loads(body.decode("utf-8"))
+                words = request["words"] if "words" in request else [request["word"]]
+                algorithm = request.get("algorithm", "silva")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                raise HTTPError(400, 'expected {"words": [...]} or {"word": ...}')
+            if not isinstance(words, list):
+                raise HTTPError(400, "words must be a list of strings")
+        else:
+            raise HTTPError(405, "use GET or POST")
+
+        if algorithm not in ALGORITHMS:
+            raise HTTPError(400, "unknown algorithm")
+        if len(words) > MAX_WORDS:
+            raise HTTPError(413, "too many words")
+        if not all(isinstance(w, type("")) and w.strip() for w in words):
+            raise HTTPError(400, "words must be non-empty strings")
+
+        batcher = self.batchers[algorithm]
+        results = await asyncio.gather(
+            *[batcher.transcribe(word.strip()) for word in words]
+        )
+
+        return results[0] if method == "GET" else {"results": results}
+
+
+async def serve(
+    host, port, workers, batch_size, max_wait, cache=0, lexicon=None, sock=None
+):
+    """
+    Run the service until SIGINT or SIGTERM, then stop the worker processes.
+
+    """
+    service = TranscriptionService(workers, batch_size, max_wait, cache, lexicon)
+    await service.start(host, port, sock)
+    if sock is None:
+        print("Serving on http://{0}:{1}/".format(host, port), flush=True)
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        await service.close()
+
+
+def prefork(host, port, processes, batch_size, max_wait, cache=0, lexicon=None):
+    """
+    Load the resources, the cache and the lexicon once, then fork processes
+    that accept the connections of the same listening socket and transcribe
+    in a thread of their own. The children share the parent's pages
+    copy-on-write and the lexicon's mmap, so that adding a process costs
+    only the memory it writes. SIGINT or SIGTERM stop all the processes.
+
+    Args:
+        host: Host, e.g. "127.0.0.1"
+        port: Port, e.g. 8000
+        processes: Number of child processes
+        batch_size: Maximum number of words per batch
+        max_wait: Seconds to wait for more words to batch
+        cache: Capacity of the LRU cache of each process, 0 for no cache
+        lexicon: Path of a compiled lexicon, or None
+
+    """
+    init_worker(cache, lexicon)
+    # Move the loaded objects out of the collector's generations: the
+    # collections in the children would otherwise write to (and copy) every
+    # page holding them
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+    sock.setblocking(False)
+
+    children = []
+
+    def stop(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    # Set before forking, so that no signal is lost in between
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for _ in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                asyncio.run(serve(host, port, 0, batch_size, max_wait, sock=sock))
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+        children.append(pid)
+    print(
+        "Serving on http://{0}:{1}/ ({2} processes)".format(host, port, processes),
+        flush=True,
+    )
+    for pid in children:
+        os.waitpid(pid, 0)
+    sock.close()
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(description="HTTP transcription service")
+    # Parse command line arguments
+    parser.add_argument("--host", dest="host", default="127.0.0.1", help="Host")
+    parser.add_argument("-p", "--port", dest="port", default=8000, type=int)
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        default=1,
+        type=int,
+        help="Worker processes, 0 to transcribe in a thread (default: 1)",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        dest="batch_size",
+        default=64,
+        type=int,
+        help="Maximum number of words per batch (default: 64)",
+    )
+    parser.add_argument(
+        "-t",
+        "--max-wait",
+        dest="max_wait",
+        default=2.0,
+        type=float,
+        help="Milliseconds to wait for more words to batch (default: 2)",
+    )
+    parser.add_argument(
+        "-P",
+        "--prefork",
+        dest="prefork",
+        default=0,
+        type=int,
+        help="Fork N processes sharing the resources loaded once, instead of "
+        "the worker processes",
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        dest="cache",
+        default=0,
+        type=int,
+        help="Cache the results of the N most recently used words, per process",
+    )
+    parser.add_argument(
+        "-l",
+        "--lexicon",
+        dest="lexicon",
+        default=None,
+        help="Compiled lexicon looked up before the rules (python -m g2p.lexicon)",
+    )
+    args = parser.parse_args()
+    if args.lexicon and not os.path.exists(args.lexicon):
+        parser.error('the file "%s" does not exist!' % args.lexicon)
+    if args.lexicon:
+        check_lexicon(args.lexicon)
+
+    max_wait = args.max_wait / 1000.0
+    if args.prefork > 0:
+        prefork(
+            args.host,
+            args.port,
+            args.prefork,
+            args.batch_size,
+            max_wait,
+            args.cache,
+            args.lexicon,
+        )
+    else:
+        if args.workers == 0:
+            init_worker(args.cache, args.lexicon)
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.workers,
+                args.batch_size,
+                max_wait,
+                args.cache,
+                args.lexicon,
+            )
+        )
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# store.py - Persistent SQLite cache of the transcriber results
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import sqlite3
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages whose sources and resources determine the transcriber results
+PACKAGES = ["g2p", "syllables", "stress"]
+
+# Extensions of the sources and resources
+EXTENSIONS = (".py", ".txt")
+
+
+def get_sources():
+    """
+    Returns the files whose content determines the transcriber results: the
+    Python modules and the resources of the packages, relative to the root.
+
+    Returns: Sorted list of paths, e.g. ["g2p/__init__.py", "g2p/cache.py",
+        ..., "syllables/silva2011.py"]
+
+    """
+    sources = []
+    for package in PACKAGES:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(ROOT, package)):
+            dirnames[:] = [name for name in dirnames if name != "__pycache__"]
+            for name in filenames:
+                if name.endswith(EXTENSIONS):
+                    path = os.path.relpath(os.path.join(dirpath, name), ROOT)
+                    sources.append(path.replace(os.sep, "/"))
+
+    return sorted(sources)
+
+
+# Maximum number of words per query, below the SQLite variables limit
+CHUNK = 500
+
+_fingerprint = None
+
+
+def get_fingerprint():
+    """
+    Returns the version fingerprint of the rules and resources, i.e. a hash
+    of the files returned by get_sources. It changes whenever a rule or a
+    resource changes.
+
+    Returns: Hexadecimal SHA-1 digest, e.g. "3f786850e387550fdab8..."
+
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        sha = hashlib.sha1()
+        for name in get_sources():
+            sha.update(name.encode("utf-8"))
+            with open(os.path.join(ROOT, name), "rb") as f:
+                sha.update(f.read())
+        _fingerprint = sha.hexdigest()
+
+    return _fingerprint
+
+
+class SQLiteStore(object):
+    """
+    Persistent cache of the transcriber results in a SQLite database, keyed
+    by (word, algorithm) and the version fingerprint. The results of other
+    versions are never returned, but they are kept, since the file may be
+    shared by other checkouts: prune() removes them.
+
+    The writes are committed by commit() or close(), or on leaving a with
+    block.
+
+    """
+
+    def __init__(self, path, fingerprint=None, prune=False):
+        self.path = path
+        self.fingerprint = fingerprint or get_fingerprint()
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "version TEXT NOT NULL, algorithm TEXT NOT NULL, word TEXT NOT NULL, "
+            "transcription TEXT, syllables TEXT, stress_syllables TEXT, "
+            "PRIMARY KEY (version, algorithm, word))"
+        )
+        self.connection.commit()
+        if prune:
+            self.prune()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get(self, word, algorithm):
+        """
+        Returns the stored result of a word.
+
+        Args:
+            word: Normalized word, e.g. "guerra"
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+
+        Returns: Dictionary with the result, or None if it is not stored
+
+        """
+        return self.get_many([word], algorithm).get(word)
+
+    def get_many(self, words, algorithm):
+        """
+        Returns the stored results of many words, with one query per chunk.
+
+        Args:
+            words: Normalized words, e.g. ["guerra", "molho"]
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+
+        Returns: Dictionary from word to result, only of the stored words
+
+        """
+        words, results = list(set(words)), {}
+        for k in range(0, len(words), CHUNK):
+            chunk = words[k : k + CHUNK]
+            rows = self.connection.execute(
+                "SELECT word, transcription, syllables, stress_syllables "
+                "FROM results WHERE version = ? AND algorithm = ? "
+                "AND word IN ({0})".format(",".join("?" * len(chunk))),
+                [self.fingerprint, algorithm] + chunk,
+            )
+            for word, transcription, syllables, stress_syllables in rows:
+                results[word] = {
+                    "word": word,
+                    "transcription": transcription,
+                    "syllables": syllables,
+                    "stress_syllables": stress_syllables,
+                }
+
+        return results
+
+    def put(self, word, algorithm, result):
+        """
+        Store the result of a word.
+
+        Args:
+            word: Normalized word, e.g. "guerra"
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+            result: Dictionary with the transcription, syllables and stress
+                syllables of the word
+
+        """
+        self.put_many([dict(result, word=word)], algorithm)
+
+    def put_many(self, results, algorithm):
+        """
+        Store the results of many words in a single statement.
+
+        Args:
+            results: Iterable of dictionaries as returned by transcribe_many
+            algorithm: Syllabification algorithm, "silva" or "ceci"
+
+        """
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    self.fingerprint,
+                    algorithm,
+                    result["word"],
+                    result["transcription"],
+                    result["syllables"],
+                    result["stress_syllables"],
+                )
+                for result in results
+            ],
+        )
+
+    def prune(self):
+        """
+        Remove the results of the other versions.
+
+        Returns: Number of results removed
+
+        """
+        removed = self.connection.execute(
+            "DELETE FROM results WHERE version != ?", (self.fingerprint,)
+        ).rowcount
+        self.connection.commit()
+
+        return removed
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# streams.py - Text streams of the command line tools: files or
+# stdin/stdout, gzip/xz compressed or not, with large buffers
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import gzip
+import io
+import sys
+
+try:
+    import lzma
+except ImportError:  # Python 2
+    lzma = None
+
+# Size of the read and write buffers
+BUFFER_SIZE = 1 << 20
+
+# Magic numbers of the compressed formats
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+def _open_xz(fileobj, mode):
+    if lzma is None:
+        raise IOError("xz files need the lzma module (Python 3)")
+    return lzma.LZMAFile(fileobj, mode)
+
+
+def open_input(path, newline=None):
+    """
+    Open a text input for reading line by line. gzip and xz inputs are
+    detected by their magic number and decompressed on the fly.
+
+    Args:
+        path: File path, or "-" for stdin
+        newline: As in io.open, "" keeps the line endings untranslated
+
+    Returns: Text stream in UTF-8
+
+    """
+    if path == "-":
+        raw = io.BufferedReader(
+            io.FileIO(sys.stdin.fileno(), "rb", closefd=False), BUFFER_SIZE
+        )
+        magic = raw.peek(len(XZ_MAGIC))[: len(XZ_MAGIC)]
+    else:
+        with io.open(path, "rb") as f:
+            magic = f.read(len(XZ_MAGIC))
+        raw = path
+
+    # Compressed files are opened by path, so closing the stream closes them
+    if magic.startswith(GZIP_MAGIC):
+        raw = gzip.open(raw, "rb")
+    elif magic.startswith(XZ_MAGIC):
+        raw = _open_xz(raw, "rb")
+    elif path != "-":
+        raw = io.open(path, "rb", buffering=BUFFER_SIZE)
+
+    return io.TextIOWrapper(raw, encoding="utf-8", newline=newline)
+
+
+def open_output(path):
+    """
+    Open a text output through a large write buffer. Files ending in ".gz"
+    or ".xz" are compressed.
+
+    Args:
+        path: File path, or "-" for stdout
+
+    Returns: Text stream in UTF-8, lines are written as given
+
+    """
+    if path == "-":
+        sys.stdout.flush()
+        raw = io.FileIO(sys.stdout.fileno(), "wb", closefd=False)
+    elif path.endswith(".gz"):
+        raw = gzip.open(path, "wb")
+    elif path.endswith(".xz"):
+        raw = _open_xz(path, "wb")
+    else:
+        raw = io.FileIO(path, "wb")
+
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, BUFFER_SIZE), encoding="utf-8", newline=""
+    )
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# text.py - Tokenize running text and transcribe its words, in a stream
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from .g2p import transcribe_many
+
+import re
+
+# Words: letters, with inner apostrophes (e.g. "d'água"); the hyphens of the
+# compounds (e.g. "guarda-chuva") are tokens of their own, so that every
+# part is transcribed as a word
+WORD = r"[^\W\d_]+(?:['’][^\W\d_]+)*"
+
+# Numbers, e.g. "1.500,00"
+NUMBER = r"\d+(?:[.,]\d+)*"
+
+# Words, numbers, punctuation marks and symbols
+TOKENS = re.compile(
+    r"(?P<word>{0})|{1}|[^\w\s]|_+".format(WORD, NUMBER), re.UNICODE
+)
+
+APOSTROPHES = re.compile("['’]", re.UNICODE)
+
+
+def tokenize(text, offset=0):
+    """
+    Split running text into tokens, skipping the spaces.
+
+    Args:
+        text: Input text, e.g. "Dá-lo, d'água."
+        offset: Offset of the text in the whole document
+
+    Returns: Generator of (token, start, end, is_word) tuples, e.g.
+        ("Dá", 0, 2, True), ("-", 2, 3, False), ("lo", 3, 5, True), ...
+
+    """
+    for match in TOKENS.finditer(text):
+        yield (
+            match.group(),
+            offset + match.start(),
+            offset + match.end(),
+            match.group("word") is not None,
+        )
+
+
+def tokenize_stream(lines):
+    """
+    Tokenize a text line by line, so that only one line is in memory.
+
+    Args:
+        lines: Iterable of lines, e.g. a file object
+
+    Returns: Generator of tokens as returned by tokenize, with the offsets
+        counted in characters from the start of the text
+
+    """
+    offset = 0
+    for line in lines:
+        for token in tokenize(line, offset):
+            yield token
+        offset += len(line)
+
+
+def _transcribe(words, algorithm, kwargs):
+    try:
+        return transcribe_many(words, algorithm, dedup=True, **kwargs)
+    except (IndexError, ValueError):
+        # Some words break the rules (the lexicon matches the algorithm, see
+        # transcribe_text): transcribe the batch word by word
+        results = []
+        for word in words:
+            try:
+                results.extend(transcribe_many([word], algorithm, **kwargs))
+            except (IndexError, ValueError):
+                results.append(None)
+        return results
+
+
+def transcribe_text(lines, algorithm="silva", chunk=1000, **kwargs):
+    """
+    Tokenize a text and transcribe its words, chunk by chunk. Only the
+    words go through the transcriber, without their apostrophes.
+
+    Args:
+        lines: Iterable of lines, e.g. a file object
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+        chunk: Number of words transcribed at a time
+        kwargs: cache, store and lexicon, as in transcribe_many; a lexicon
+            built with the other algorithm is not used
+
+    Returns: Generator of dictionaries, one per token, e.g.
+        {"token": "Casa", "start": 0, "end": 4, "is_word": True,
+         "result": {"word": "casa", "transcription": "ˈka.za", ...}}
+        the result is None for the other tokens and for the words the
+        rules cannot transcribe
+
+    """
+    lexicon = kwargs.get("lexicon")
+    if lexicon is not None and lexicon.algorithm != algorithm:
+        # The lexicon only serves the algorithm it was compiled with
+        kwargs = dict(kwargs, lexicon=None)
+    tokens, words = [], []
+    for token in tokenize_stream(lines):
+        tokens.append(token)
+        if token[3]:
+            words.append(APOSTROPHES.sub("", token[0]))
+        if len(words) == chunk:
+            for item in _flush(tokens, words, algorithm, kwargs):
+                yield item
+            tokens, words = [], []
+    for item in _flush(tokens, words, algorithm, kwargs):
+        yield item
+
+
+def _flush(tokens, words, algorithm, kwargs):
+    results = iter(_transcribe(words, algorithm, kwargs) if words else [])
+    for text, start, end, is_word in tokens:
+        yield {
+            "token": text,
+            "start": start,
+            "end": end,
+            "is_word": is_word,
+            "result": next(results) if is_word else None,
+        }
@@ -22,24 +22,90 @@
 import codecs
 
 
-def load_prefixes(PATH_PREFIXES):
+def read_prefixes(PATH_PREFIXES):
     """
-    Return a list of prefixes and their phonemes.
+    Return the lines of the prefixes file, split in columns: the prefixes
+    and their phonemes, and the override lines.
 
     Args:
         PATH_PREFIXES: Prefixes file path
 
-    Returns: List of prefixes and their phonemes, e.g, "crip-to	kɾipɪ-to"
+    Returns: List of tuples, e.g. ("crip-to", "kɾipɪ-to")
 
     """
     # Open file
     f = codecs.open(PATH_PREFIXES, "r", "utf-8")
-    # Get prefixes
-    prefixes = [tuple(line.strip().split("\t")) for line in f.readlines()]
+    # Get the lines of the prefixes and of their overrides
+    entries = [tuple(line.strip().split("\t")) for line in f.readlines()]
     # Close file
     f.close()
 
-    return prefixes
+    return entries
+
+
+def load_prefixes(PATH_PREFIXES):
+    """
+    Return a list of prefixes and their phonemes, without the override
+    lines (see load_prefix_overrides).
+
+    Args:
+        PATH_PREFIXES: Prefixes file path
+
+    Returns: List of prefixes and their phonemes, e.g, "crip-to	kɾipɪ-to"
+
+    """
+    return [entry for entry in read_prefixes(PATH_PREFIXES) if len(entry) < 3]
+
+
+def load_prefix_overrides(PATH_PREFIXES):
+    """
+    Return a list of the override lines of the prefixes. An override line
+    has a third column with the syllables of the words it applies to,
+    ending with '*' for the words starting with them.
+
+    Args:
+        PATH_PREFIXES: Prefixes file path
+
+    Returns: List of prefixes, their phonemes and words, e.g.
+        "te-le	te-le	te-le-fo-ne*"
+
+    """
+    return [entry for entry in read_prefixes(PATH_PREFIXES) if len(entry) > 2]
+
+
+def load_prefix_trie(PATH_PREFIXES):
+    """
+    Return the prefixes compiled into a trie of their letters. The node of
+    a prefix holds, under the "" key, its phonemes and its override
+    entries (see load_prefix_overrides).
+
+    Args:
+        PATH_PREFIXES: Prefixes file path
+
+    Returns: Nested dictionaries, e.g.
+        {"t": {"e": {"-": {"l": {"e": {"": ("tɛ-le", [...])}}}}}}
+
+    """
+    trie, overrides = {}, []
+    for entry in read_prefixes(PATH_PREFIXES):
+        if len(entry) > 2:
+            overrides.append(entry)
+            continue
+        prefix, phones = entry
+        node = trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        # The first entry of a prefix wins
+        node.setdefault("", (phones, []))
+
+    for prefix, phones, word in overrides:
+        node = trie
+        for ch in prefix:
+            node = node.get(ch, {})
+        if "" in node:
+            node[""][1].append((word.rstrip("*"), word.endswith("*"), phones))
+
+    return trie
 
 
 def load_homographs_heterophones(PATH_HOMOGRAPHS_HETEROPHONES):
@@ -65,3 +131,4 @@ def load_homographs_heterophones(PATH_HOMOGRAPHS_HETEROPHONES):
     f.close()
 
     return dct
+
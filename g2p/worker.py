@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# worker.py - State of a long-lived transcribing process and its batches of
+# words, shared by the HTTP service and the co-process
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+from .g2p import G2PTranscriber, transcribe_many, normalize_word, preload
+from .cache import LRUCache
+from .lexicon import Lexicon
+
+ALGORITHMS = ["silva", "ceci"]
+
+# Maximum number of words of a request
+MAX_WORDS = 10000
+
+# State of a transcribing process, set by init_worker
+_worker = {"cache": None, "lexicon": None}
+
+
+def init_worker(cache=0, lexicon=None):
+    """
+    Load the resources of both algorithms, and open the cache and the
+    lexicon used by transcribe_batch in this process.
+
+    Args:
+        cache: Capacity of the LRU cache, 0 for no cache
+        lexicon: Path of a compiled lexicon (python -m g2p.lexicon), or None
+
+    """
+    for algorithm in ALGORITHMS:
+        preload(algorithm)
+    _worker["cache"] = LRUCache(cache) if cache > 0 else None
+    _worker["lexicon"] = Lexicon(lexicon) if lexicon else None
+
+
+def transcribe_batch(words, algorithm):
+    """
+    Transcribe a batch of words; the words the rules cannot transcribe get
+    an error instead of failing the whole batch.
+
+    Args:
+        words: List of input words, e.g. ["guerra", "molho"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    Returns: List of dictionaries as returned by transcribe_many, or
+        {"word": ..., "error": ...} for the words in error
+
+    """
+    lexicon = _worker["lexicon"]
+    kwargs = {
+        "cache": _worker["cache"],
+        # The lexicon only serves the algorithm it was compiled with
+        "lexicon": lexicon if lexicon and lexicon.algorithm == algorithm else None,
+    }
+    try:
+        return transcribe_many(words, algorithm, dedup=True, **kwargs)
+    except (IndexError, ValueError):
+        results = []
+        for word in words:
+            try:
+                results.extend(transcribe_many([word], algorithm, **kwargs))
+            except (IndexError, ValueError):
+                results.append(
+                    {"word": normalize_word(word), "error": "cannot transcribe"}
+                )
+        return results
+
+
+def syllabify_batch(words, algorithm):
+    """
+    Separate the syllables and find the stress syllable of a batch of
+    words, with a single G2P transcriber and without the phonetic rules.
+
+    Args:
+        words: List of input words, e.g. ["guerra", "molho"]
+        algorithm: Syllabification algorithm, "silva" or "ceci"
+
+    Returns: List of dictionaries, e.g. {"word": "guerra", "syllables":
+        "gue-rra", "stress_syllables": "[gue]-rra"}, or {"word": ...,
+        "error": ...} for the words in error
+
+    """
+    results, g2p = [], None
+    for word in words:
+        try:
+            if g2p is None:
+                g2p = G2PTranscriber(word, algorithm=algorithm)
+            else:
+                g2p.set_word(word)
+            results.append(
+                {
+                    "word": g2p.word,
+                    "syllables": g2p.syllables,
+                    "stress_syllables": g2p.get_syllables_with_stress_boundaries(),
+                }
+            )
+        except (IndexError, ValueError):
+            results.append({"word": normalize_word(word), "error": "cannot transcribe"})
+
+    return results
@@ -25,6 +25,100 @@ from __future__ import unicode_literals
 import re
 
 
+# Rule 1: if the vowel has an accent then it is a tonic vowel
+ACCENTS = re.compile("á|é|í|ó|ú|â|ê|ô|à|ã|õ", re.UNICODE)
+
+# Vowels used by rules 17 and 19
+VOWELS = "aeiou"
+
+# Consonants used by rule 16
+CONSONANTS = "bdfghjklmnñpqrstvxyz"
+
+# Rules 2 to 18 that only look at the end of the word, in the order they are
+# tried: (rule id, suffix pattern, tonic position counted from the end). A
+# pattern starting with '^' must match the whole word.
+SUFFIX_RULES = [
+    # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
+    ("2", "[rlzxn]", 2),
+    # Rule 3: if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
+    ("3", "[iou]m", 2),
+    # Rule 4: if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
+    ("4", "[iou]ns", 3),
+    # Rule 5: if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
+    ("5", "[qg][uü]i", 1),
+    # Rule 6: if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g} then T = 1
+    ("6", "[qg][uü]is", 2),
+    # Rule 7: if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
+    ("7a", "[aeiou][iu]", 2),
+    # Rule 7: if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
+    ("7b", "[^aeiou][iu]", 1),
+    # Rule 8: if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
+    ("8", "[aeiou][iu]s", 3),
+    # Rule 9: if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
+    ("9", "[^aeiou][iu]s", 2),
+    # Rule 10: if ^(0) = {e} & ^(1) = {u} & ^(2) = {q} & ^(3) = {r} &
+    # ^(4) = {o} & ^(4) = {p} then T = 0
+    ("10", "^porque", 1),
+    # Rule 11: if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u}
+    # then T = 3
+    ("11a", "[aeiou][qg]ue", 4),
+    # Rule 11: if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u}
+    # then T = 4
+    ("11b", "[^aeiou][qg]ue", 5),
+    # Rule 12: if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou}
+    # then T = 4
+    ("12a", "[aeiou][qg]ues", 5),
+    # Rule 12: if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou}
+    # then T = 5
+    ("12b", "[^aeiou][qg]ues", 6),
+    # Rule 13: if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u}
+    # then T = 2
+    ("13", "[aeiou][iu][aeiou]", 3),
+    # Rule 14: if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} &
+    # ^(1) != {a,e,i,o,u} & ^(4) != {q,g} then T = 3
+    ("14", "[^qg][aeiou][iu][^aeiou][aeiou]", 4),
+    # Rule 15: if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
+    # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
+    ("15", "[^qg][aeiou][iu][^aeiou][aeiou]s", 5),
+    # Rule 16: if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
+    # ^(4) = {a,e,i,o,u} then T = 3
+    ("16", "[aeiou][iu]n[" + CONSONANTS + "][aeo]", 4),
+    # Rule 18: if ^(0) = {m} & ^(1) = {e} & ^(2) = {u} & ^(3) = {q} then T = 1
+    # (rule 17 never applies to "quem", so it can be tried before it)
+    ("18", "^quem", 2),
+]
+
+
+def compile_suffix_rules(rules):
+    """
+    Compile the suffix rules into a single pattern matched against the
+    reversed word. re.match tries the alternatives in order at the first
+    position, so the first rule of the list that applies is the one found.
+
+    Args:
+        rules: List of (rule id, suffix pattern, tonic position from the end)
+
+    Returns: Compiled pattern and a dictionary from group name to position
+
+    """
+    alternatives, offsets = [], {}
+    for rule, pattern, offset in rules:
+        whole = pattern.startswith("^")
+        tokens = re.findall(r"\[[^\]]*\]|.", pattern[1:] if whole else pattern)
+        group = "r" + rule
+        alternatives.append(
+            "(?P<{0}>{1}{2})".format(
+                group, "".join(reversed(tokens)), "\\Z" if whole else ""
+            )
+        )
+        offsets[group] = offset
+
+    return re.compile("|".join(alternatives), re.UNICODE), offsets
+
+
+SUFFIXES, SUFFIX_OFFSETS = compile_suffix_rules(SUFFIX_RULES)
+
+
 class StressDetector(object):
     """
     This class implements the tonic/stress detection presented in
@@ -34,6 +128,9 @@ class StressDetector(object):
         de Voz com Emoções Aplicados a um Conversor Text-Fala Baseado
         em HMM. PhD dissertation, COPPE, UFRJ.
 
+    The results are cached for the current word, so the stress position is
+    computed once per word even when the detector is reused for other words.
+
     """
 
     def __init__(self, word):
@@ -41,6 +138,10 @@ class StressDetector(object):
             self.word = word.decode("utf-8").lower()
         except:
             self.word = word.lower()
+        # Cached results of the current word, as (key, result)
+        self._vowel = (None, -1)
+        self._vowel_with_hyphen = (None, -1)
+        self._syllable_with_hyphen = (None, (0, 0))
 
     def get_stress_vowel(self):
         """
@@ -51,126 +152,52 @@ class StressDetector(object):
 
         Returns: The position of the tonic vowel in the word, e.g. 6 -> 'o'
 
+        """
+        if self._vowel[0] != self.word:
+            self._vowel = (self.word, self.find_stress_vowel(self.word))
+
+        return self._vowel[1]
+
+    @staticmethod
+    def find_stress_vowel(word):
+        """
+        Apply the stress rules to a word, without caching.
+
+        Args:
+            word: Input word, e.g. "chocolate"
+
+        Returns: The position of the tonic vowel in the word, e.g. 6 -> 'o'
+
         """
         # Rule 1:
         # If the vowel has an accent then it is a tonic vowel
-        match = re.search("á|é|í|ó|ú|â|ê|ô|à|ã|õ", self.word, re.UNICODE)
+        match = ACCENTS.search(word)
         if match:
             return match.start()
 
         # TODO Word with len(word) > 2
 
-        # Rule 2: if ^(0) = {r,l,z,x,n} then T = 1
-        if re.search("[rlzxn]$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 3:
-        # if ^(0) = {m} & ^(1) = {i,o,u} then T = 1
-        if re.search("[iou]m$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 4:
-        # if ^(0) = {s} & ^(1) = {n} & ^(2) = {i,o,u} then T = 1
-        if re.search("[iou]ns$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 5:
-        # if ^(0) = {i} & ^(1) = {u,ü} & ^(2) = {q,g} then T = 0
-        if re.search("[qg][uü]i$", self.word, re.UNICODE):
-            return len(self.word) - 1
-
-        # Rule 6:
-        # if ^(0) = {s} & ^(1) = {i} & ^(2) = {u,ü} & ^(3) = {q,g} then T = 1
-        if re.search("[qg][uü]is$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 7:
-        # if ^(0) = {i,u} & ^(1) = {a,e,i,o,u} then T = 1
-        if re.search("[aeiou][iu]$", self.word, re.UNICODE):
-            return len(self.word) - 2
-        # if ^(0) = {i,u} & ^(1) != {a,e,i,o,u} then T = 0
-        if re.search("[^aeiou][iu]$", self.word, re.UNICODE):
-            return len(self.word) - 1
-
-        # Rule 8:
-        # if ^(0) = {s} & ^(1) = {i,u} & ^(2) = {a,e,i,o,u} then T = 2
-        if re.search("[aeiou][iu]s$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 9:
-        # if ^(0) = {s} & ^(1) = {i,u} & ^(2) != {a,e,i,o,u} then T = 2
-        if re.search("[^aeiou][iu]s$", self.word, re.UNICODE):
-            return len(self.word) - 2
-
-        # Rule 10:
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {q} & ^(3) = {r} & ^(4) = {o} &
-        # ^(4) = {p} then T = 0
-        if self.word == "porque":
-            return len(self.word) - 1
-
-        # Rule 11
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) = {a,e,i,o,u} then T = 3
-        if re.search("[aeiou][qg]ue$", self.word, re.UNICODE):
-            return len(self.word) - 4
-        # if ^(0) = {e} & ^(1) = {u} & ^(2) = {qg} & ^(3) != {a,e,i,o,u} then T = 4
-        if re.search("[^aeiou][qg]ue$", self.word, re.UNICODE):
-            return len(self.word) - 5
-
-        # Rule 12
-        # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)={aeiou} then T = 4
-        if re.search("[aeiou][qg]ues$", self.word, re.UNICODE):
-            return len(self.word) - 5
-        # if ^(0)={e} & ^(1)={e} & ^(2)={u} & ^(3)={qg} & ^(4)!={aeiou} then T = 5
-        if re.search("[^aeiou][qg]ues$", self.word, re.UNICODE):
-            return len(self.word) - 6
-
-        # Rule 13:
-        # if ^(0) = {a,e,i,o,u} & ^(2) = {i,u} & ^(3) = {a,e,i,o,u} then T = 2
-        if re.search("[aeiou][iu][aeiou]$", self.word, re.UNICODE):
-            return len(self.word) - 3
-
-        # Rule 14:
-        # if ^(0) & ^(3) = {a,e,i,o,u} & ^(2) = {i,u} & ^(1) != {a,e,i,o,u} &
-        # ^(4) != {q,g} then T = 3
-        if re.search("[^qg][aeiou][iu][^aeiou][aeiou]$", self.word, re.UNICODE):
-            return len(self.word) - 4
-
-        # Rule 15:
-        # if ^(0) = {s} & ^(1) & ^(4) = {a,e,i,o,u} & ^(3) = {i,u} &
-        # ^(2) != {a,e,i,o,u} & ^(5) != {q,g} then T = 4
-        if re.search("[^qg][aeiou][iu][^aeiou][aeiou]s$", self.word, re.UNICODE):
-            return len(self.word) - 5
-
-        # Rule 16:
-        # if ^(0) = {a,e,o} & ^(1) = cons & ^(2) = {n} & ^(3) = {i,u} &
-        # ^(4) = {a,e,i,o,u} then T = 3
-        consts = "bdfghjklmnñpqrstvxyz"
-        if re.search("[aeiou][iu]n[" + consts + "][aeo]$", self.word, re.UNICODE):
-            return len(self.word) - 4
+        # Rules 2 to 16 and 18
+        match = SUFFIXES.match(word[::-1])
+        if match:
+            return len(word) - SUFFIX_OFFSETS[match.lastgroup]
 
         # Rule 17:
-        matches = [m.start() for m in re.finditer("a|e|i|o|u", self.word, re.UNICODE)]
+        matches = [k for k, ch in enumerate(word) if ch in VOWELS]
         if len(matches) >= 2:
             k = matches[-2]
-            v = ["a", "e", "i", "o", "u"]
             if (
-                self.word[k] in ["i", "u"]
-                and self.word[k - 1] in v
-                and not self.word[k + 1] in v
+                word[k] in ["i", "u"]
+                and word[k - 1] in VOWELS
+                and not word[k + 1] in VOWELS
             ):
                 if k - 2 < 0:
                     return 0
-                if not self.word[k - 2] in ["q", "g"]:
+                if not word[k - 2] in ["q", "g"]:
                     return k - 1
 
-        # Rule 18:
-        # if ^(0) = {m} & ^(1) = {e} & ^(2) = {u} & ^(3) = {q} then T = 1
-        if self.word == "quem":
-            return len(self.word) - 2
-
         # Rule 19:
         # Penultimate vowel of the word
-        matches = [m.start() for m in re.finditer("a|e|i|o|u", self.word, re.UNICODE)]
         if len(matches) >= 2:
             return matches[-2]
 
@@ -186,6 +213,16 @@ class StressDetector(object):
         Returns: Position of the tonic vowel in syllables, e.g. 8 -> 'o'
 
         """
+        key = (self.word, syllables)
+        if self._vowel_with_hyphen[0] != key:
+            self._vowel_with_hyphen = (
+                key,
+                self._find_stress_vowel_with_hyphen(syllables),
+            )
+
+        return self._vowel_with_hyphen[1]
+
+    def _find_stress_vowel_with_hyphen(self, syllables):
         a, b, stress = 0, 0, self.get_stress_vowel()
         while a < len(syllables):
             if syllables[a] != self.word[b]:
@@ -226,7 +263,17 @@ class StressDetector(object):
         Returns: Stress syllable position, e.g. (3, 6) -> 'cho'
 
         """
-        mtch = [match.start() for match in re.finditer("-", syllables)]
+        key = (self.word, syllables)
+        if self._syllable_with_hyphen[0] != key:
+            self._syllable_with_hyphen = (
+                key,
+                self._find_stress_syllable_with_hyphen(syllables),
+            )
+
+        return self._syllable_with_hyphen[1]
+
+    def _find_stress_syllable_with_hyphen(self, syllables):
+        mtch = [k for k, ch in enumerate(syllables) if ch == "-"]
         stress = self.get_stress_vowel_with_hyphen(syllables)
         tmp1, tmp2 = 0, len(syllables)
         for i in range(len(mtch)):
@@ -1,51 +1,101 @@
-def case1(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 1] + "-" + w[p[k] + 1 :]
+class SyllableCuts(object):
+    """
+    Syllable boundaries of a word, as offsets into the word itself. The word
+    is never modified: the hyphenated word read by the rules is derived from
+    the offsets when needed.
+
+    Args:
+        word: Input word, e.g. "guerra"
+
+    """
+
+    def __init__(self, word):
+        self.word = word
+        # Offsets of the boundaries in the word, in increasing order; the same
+        # offset twice is an empty syllable
+        self.offsets = []
+        self._text = word
+
+    def insert(self, i):
+        """
+        Insert a boundary before the letter i of the hyphenated word, as
+        w[:i] + "-" + w[i:] does.
+
+        Args:
+            i: Position in the hyphenated word
+
+        """
+        offsets = self.offsets
+        # The j-th boundary is at j + offsets[j] in the hyphenated word
+        j = 0
+        while j < len(offsets) and j + offsets[j] < i:
+            j += 1
+        offsets.insert(j, min(i - j, len(self.word)))
+        self._text = None
+
+    def text(self):
+        """
+        Returns the hyphenated word, e.g. "gue-rra"
+
+        """
+        if self._text is None:
+            word, start, parts = self.word, 0, []
+            for offset in self.offsets:
+                parts.append(word[start:offset])
+                start = offset
+            parts.append(word[start:])
+            self._text = "-".join(parts)
+        return self._text
+
+
+def case1(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 1)
     p0 = p[k] + 1
     k = k + 1 if k + 1 < len(p) else k
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case2(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 2] + "-" + w[p[k] + 2 :]
+def case2(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 2)
     p0 = p[k] + 2
     k = k + 1 if k + 1 < len(p) else k
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case3(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 1] + "-" + w[p[k] + 1 :]
+def case3(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 1)
     p0 = p[k] + 1
     k += 1
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case4(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 2] + "-" + w[p[k] + 2 :]
+def case4(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 2)
     p0 = p[k] + 2
     k = k + 1 if k + 1 < len(p) else k
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case5(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 3] + "-" + w[p[k] + 3 :]  # Case 5
+def case5(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 3)  # Case 5
     p0 = p[k] + 3
     k += 1
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
 def case6(w, p0):
@@ -53,41 +103,41 @@ def case6(w, p0):
     return p0
 
 
-def case7(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 3] + "-" + w[p[k] + 3 :]  # Case 5
+def case7(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 3)  # Case 5
     p0 = p[k] + 3
     k += 1
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case8(w, p, p0, pVt, k, c):
-    w = w[: p[k] + 1] + "-" + w[p[k] + 1 :]
+def case8(cuts, p, p0, pVt, k, c):
+    cuts.insert(p[k] + 1)
     p0 = p[k] + 1
     k += 1
     c += 1
     p[k] = p[k] + c
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case9(w, p, p0, pVt, k, c):
-    w = w[: p0 + 1] + "-" + w[p0 + 1 :]
+def case9(cuts, p, p0, pVt, k, c):
+    cuts.insert(p0 + 1)
     p0 += 1
     k = k
     c += 1
     p[k] = p[k] + 1
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
 
 
-def case10(w, p, p0, pVt, k, c):
-    w = w[: p0 + 2] + "-" + w[p0 + 2 :]
+def case10(cuts, p, p0, pVt, k, c):
+    cuts.insert(p0 + 2)
     p0 += 2
     k = k
     c += 1
     p[k] = p[k] + 1
     pVt += 1
-    return w, p0, k, c, p, pVt
+    return cuts, p0, k, c, p, pVt
@@ -23,12 +23,17 @@
 
 from __future__ import unicode_literals
 
+import sys
+
+if sys.version_info[0] == 3:
+    unichr = chr
+
 
 class CECISyllableSeparator(object):
     def __init__(self, word):
         try:
             self.word = word.decode("utf-8").lower()
-        except (UnicodeDecodeError, UnicodeEncodeError):
+        except (AttributeError, UnicodeDecodeError, UnicodeEncodeError):
             self.word = word.lower()
 
     def _get(self, la, le):
@@ -47,6 +52,27 @@ class CECISyllableSeparator(object):
             return 0
         return int(t)
 
+    def _get_actions(self, word):
+        """
+        Returns the action code of every pair of adjacent letters, looking
+        them up in the compiled CECI table.
+
+        Args:
+            word: Input word, e.g. "guerra "
+
+        Returns: List of action codes, e.g. [0, 0, 0, 1, 0, 3]
+
+        """
+        actions = []
+        for la, le in zip(word, word[1:]):
+            a, b = ord(la), ord(le)
+            action = ACTIONS[a << 8 | b] if a < 256 and b < 256 else UNKNOWN
+            if action == UNKNOWN:
+                # Letters outside the table: raises as the table lookup does
+                action = self._get_action(la.lower(), le.lower())
+            actions.append(action)
+        return actions
+
     def separate(self):
         if self.word[0] == "à":
             has_crasis = True
@@ -64,9 +90,11 @@ class CECISyllableSeparator(object):
         is_vowel = lambda x: x.lower() in "aáãâeéêiíoóôõuúü"
         is_consonant = lambda x: not is_vowel(x)
 
+        actions = self._get_actions(self.word)
+
         stop = False
         while not stop:
-            action = self._get_action(self.word[_la].lower(), self.word[_le].lower())
+            action = actions[_la]
 
             if action == 0:
                 result += self.word[_le]
@@ -136,9 +164,11 @@ class CECISyllableSeparator(object):
         is_vowel = lambda x: x.lower() in "aáãâeéêiíoóôõuúü"
         is_consonant = lambda x: not is_vowel(x)
 
+        actions = self._get_actions(word)
+
         stop = False
         while not stop:
-            action = self._get_action(word[_la].lower(), word[_le].lower())
+            action = actions[_la]
 
             if action == 0:
                 start_syllable = False
@@ -212,3 +242,37 @@ class CECISyllableSeparator(object):
         "y00001111000110001111100001111100011111",
         "z00002222000220002222200002222200022222",
     ]
+
+
+# Action code of the letter pairs that are not in the CECI table
+UNKNOWN = 255
+
+
+def compile_table(table):
+    """
+    Compile the CECI table into a dense array of action codes indexed by the
+    character codes of a pair of letters, i.e. ACTIONS[ord(la) << 8 | ord(le)].
+    Only Latin-1 letters fit in the array; the other pairs are UNKNOWN.
+
+    Args:
+        table: CECI table, the first line holds the letters
+
+    Returns: bytearray with 256 * 256 action codes
+
+    """
+    letters = table[0]
+    # Row of a letter outside the table: only non-letters have an action
+    row = bytearray(3 if not unichr(b).isalpha() else UNKNOWN for b in range(256))
+    actions = bytearray()
+    for a in range(256):
+        actions += bytearray([2]) * 256 if not unichr(a).isalpha() else row
+    # Letter pairs of the table
+    for line in table[1:]:
+        for column, le in enumerate(letters[1:], 1):
+            t = line[column]
+            actions[ord(line[0]) << 8 | ord(le)] = 0 if t.isspace() else int(t)
+
+    return actions
+
+
+ACTIONS = compile_table(CECISyllableSeparator.tab_ceci)
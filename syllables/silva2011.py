@@ -22,6 +22,7 @@
 
 from __future__ import unicode_literals
 
+from .cases import SyllableCuts
 from .cases import case1, case2, case3, case4, case5, case6, case7, case8, case9, case10
 
 import re
@@ -105,7 +106,9 @@ class Silva2011SyllableSeparator(object):
 
 	    """
         vowels = "a|e|o|i|u|á|é|í|ó|ú|ã|õ|â|ê|ô|à|ü"
-        w = self.word
+        cuts = SyllableCuts(self.word)
+        # Hyphenated word read by the rules, e.g. "gue-rra"
+        w = cuts.text()
         p = [match.start() for match in re.finditer(vowels, w, re.UNICODE)]
         p0 = 0  # Syllable start position
         pVt = self.stress  # Tonic vowel position
@@ -120,9 +123,9 @@ class Silva2011SyllableSeparator(object):
             # New rule 1:
             if w[p0 : p0 + 2] in OS:
                 if w[p0 + 2] not in C:
-                    w, p0, k, c, p, pVt = case9(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case9(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case10(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case10(cuts, p, p0, pVt, k, c)
 
             # New rule 2
             elif (
@@ -131,7 +134,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in G
                 and w[p[k] + 2] in V + G
             ):
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 1:
             elif (
@@ -144,7 +147,7 @@ class Silva2011SyllableSeparator(object):
                 if p[k] + 3 < len(w) and w[p[k] + 2] == "s" and p[k] + 3 == len(w):
                     return w
                 else:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 2:
             elif (
@@ -154,7 +157,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] in C
                 and w[p[k] + 3] in CO
             ):
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 3:
             elif (
@@ -164,18 +167,18 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] in C
             ):
                 if w[p[k] + 1] == "i" and w[p[k] + 2] in CN:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif not w[p[k] + 2] in ["s", "h"] and w[p[k] + 1] != w[p[k] + 2]:
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif (
                     p[k] + 3 < len(w)
                     and w[p[k] + 1] in CN
                     and w[p[k] + 2] == "s"
                     and not w[p[k] + 3] in V
                 ):
-                    w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case7(cuts, p, p0, pVt, k, c)
                 elif w[p[k] + 1] == w[p[k] + 2] or w[p[k] + 2] == "h":
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif (
                     p[k] + 3 < len(w)
                     and w[p[k] + 2] == "s"
@@ -184,9 +187,9 @@ class Silva2011SyllableSeparator(object):
                         or not w[p[k] + 3] in C + V
                     )
                 ):
-                    w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case7(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
 
             # Rule 4:
             elif (
@@ -198,11 +201,11 @@ class Silva2011SyllableSeparator(object):
             ):
                 """
                 if w[p[k] + 1] == w[p[k] + 2]:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 """
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 5:
             elif (
@@ -211,7 +214,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in C
                 and w[p[k] + 2] in V + G + CL + ["h"]
             ):
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 6:
             elif (
@@ -222,7 +225,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 3] in CO
             ):
                 # TODO Regra 6 esta dentro da regra 3
-                w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
 
             # Rule 7:
             elif (
@@ -232,7 +235,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in C
                 and w[p[k] + 2] in V
             ):
-                w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case3(cuts, p, p0, pVt, k, c)
 
             # Rule 8:
             elif (
@@ -243,7 +246,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] == "r"
                 and w[p[k] + 3] in C
             ):
-                w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case3(cuts, p, p0, pVt, k, c)
 
             # Rule 9:
             elif (
@@ -254,7 +257,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] == "s"
                 and w[p[k] + 3] in CO
             ):
-                w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case7(cuts, p, p0, pVt, k, c)
 
             # Rule 10:
             elif (
@@ -269,16 +272,16 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] != "s"
             ):
                 if p[k] == pVt and w[p[k] + 2] != "n" and not w[p[k] + 3] in C:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
                 elif (
                     not w[p[k] - 1] in ["q", "g"]
                     and w[p[k]] == "u"
                     and w[p[k] + 1] == "i"
                     and w[p[k] + 2] != "n"
                 ):
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif p[k] != pVt and w[p[k] + 1] == "i" and w[p[k] + 2] != "n":
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif (
                     w[p[k] + 1] != "i"
                     and w[p[k] + 2] in CN + ["r"]
@@ -295,25 +298,25 @@ class Silva2011SyllableSeparator(object):
                         and w[p[k] + 1] in V
                         and w[p[k] + 2] in CN
                     ):
-                        w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                        cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                     elif (
                         w[p[k] - 1 : p[k] + 1] == "gu"
                         and w[p[k] + 1] in V
                         and w[p[k] + 2] in CL
                     ):
-                        w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                        cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                     else:
-                        w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                        cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif (
                     w[p[k]] in G
                     and w[p[k] + 1] in ["a", "e", "o"]
                     and w[p[k] + 2] in CN
                 ):
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif w[p[k] + 2] in CN:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
 
             # Rule 11:
             elif (
@@ -323,7 +326,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in G
                 and w[p[k] + 2] in V
             ):
-                w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
 
             # Rule 12:
             elif (
@@ -342,11 +345,11 @@ class Silva2011SyllableSeparator(object):
                     (w[p[k] + 2] == "ç" and w[p[k] + 3] in ["ã", "õ"])
                     or (w[p[k] - 1] == "q" and w[p[k] + 1] in V)
                 ):
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif p[k] + 1 == pVt or w[p[k] - 1] == "r" and p[k] + 3 == pVt:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case8(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case8(cuts, p, p0, pVt, k, c)
 
             # Rule 13:
             elif (
@@ -366,9 +369,9 @@ class Silva2011SyllableSeparator(object):
                     or w[p[k] + 1] in ["c", "l"]
                     or w[p[k] + 1 : p[k] + 3] == "nh"
                 ):
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
 
             # Rule 14:
             elif (
@@ -381,9 +384,9 @@ class Silva2011SyllableSeparator(object):
                 if p[k] + 3 == len(w):
                     p0 = case6(w, p0)
                 elif p[k] == pVt or (p[k] + 3 < len(w) and w[p[k] + 3] in V):
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
 
             # Rule 15:
             elif (
@@ -399,9 +402,9 @@ class Silva2011SyllableSeparator(object):
                     and w[p[k] + 1] in G
                     and w[p[k] + 3] in C
                 ):
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 16:
             elif (
@@ -412,7 +415,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in V
                 and w[p[k] + 2] in CN
             ):
-                w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case3(cuts, p, p0, pVt, k, c)
 
             # Rule 17:
             elif (
@@ -428,7 +431,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in ["a", "o"]
             ):
                 # TODO trocar caso 6 por caso 1.
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 18:
             elif (
@@ -450,7 +453,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] in CN
                 and w[p[k] + 3] in C
             ):
-                w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case7(cuts, p, p0, pVt, k, c)
 
             # Rule 19:
             elif (
@@ -474,9 +477,9 @@ class Silva2011SyllableSeparator(object):
                     and w[p[k] + 1] in V
                     and w[p[k] + 2] in C + G
                 ):
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case3(cuts, p, p0, pVt, k, c)
 
             # Rule 21:
             elif (
@@ -487,9 +490,9 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 3] in V + G
             ):
                 if w[p[k] + 1] in ["f", "p"] and w[p[k] + 2] in ["t", "ç"]:
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 22:
             elif (
@@ -510,14 +513,14 @@ class Silva2011SyllableSeparator(object):
                     and w[p[k] + 2] == "s"
                     and not w[p[k] + 3] in C + V
                 ):
-                    w, p0, k, c, p, pVt = case3(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case3(cuts, p, p0, pVt, k, c)
                 elif (
                     p[k] + 2 == len(w)
                     and w[p[k]] == "i"
                     and p[k] == pVt
                     and w[p[k] + 1] == "u"
                 ):
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
                 elif p[k] + 3 < len(w) and (
                     (w[p[k]] in G and p[k] + 1 != pVt and not w[p[k] + 2] in C + V)
                     or (w[p[k] + 2] == "s" and not w[p[k] + 3] in C + V)
@@ -528,14 +531,14 @@ class Silva2011SyllableSeparator(object):
                         and p[k] + 3 == len(w)
                     )
                 ):
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif (
                     p[k] + 3 < len(w)
                     and w[p[k] - 1 : p[k] + 1] in ["qu", "gu"]
                     and w[p[k] + 2] in C
                     and w[p[k] + 3] in V + G
                 ):
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif (
                     p[k] + 2 == len(w)
                     and w[p[k] - 1 : p[k] + 1] in ["qu", "gu"]
@@ -548,16 +551,16 @@ class Silva2011SyllableSeparator(object):
                     and p[k] + 1 != pVt
                     and w[p[k] + 2] == "s"
                 ):
-                    w, p0, k, c, p, pVt = case7(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case7(cuts, p, p0, pVt, k, c)
                 elif (
                     w[p[k]] == "u"
                     and w[p[k] + 1] in ["e", "ê", "é"]
                     and w[p[k] + 2] in ["n", "s", "i", "l"]
                 ):
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 else:
                     # TODO Trocar case2 por case 1
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
 
             # Rule 23:
             elif (
@@ -568,13 +571,13 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] in C
             ):
                 if w[p[k] + 1] == w[p[k] + 2]:
-                    w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
                 elif w[p[k] + 1] == "s" and w[p[k] + 2] != "s":
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
                 elif p[k] + 3 < len(w) and w[p[k] + 2] == "s" and w[p[k] + 3] in CO:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case2(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case2(cuts, p, p0, pVt, k, c)
 
             # Rule 24:
             elif (
@@ -583,7 +586,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in C
                 and w[p[k] + 2] in G
             ):
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 25: Already aplicated
 
@@ -599,9 +602,9 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 2] in CN
             ):
                 if w[p[k] + 3] in C:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 else:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
 
             # Rule 27:
             elif (
@@ -612,7 +615,7 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in G
                 and w[p[k] + 2] in C
             ):
-                w, p0, k, c, p, pVt = case1(w, p, p0, pVt, k, c)
+                cuts, p0, k, c, p, pVt = case1(cuts, p, p0, pVt, k, c)
 
             # Rule 28
             elif (
@@ -622,15 +625,17 @@ class Silva2011SyllableSeparator(object):
                 and w[p[k] + 1] in V
             ):
                 if p[k] + 3 < len(w) and w[p[k] + 2] in C and w[p[k] + 3] in C:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
                 elif p[k] + 3 < len(w) and w[p[k] + 2] in C and w[p[k] + 3] in V + G:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
                 elif p[k] + 2 < len(w) and w[p[k] + 2] in V:
-                    w, p0, k, c, p, pVt = case4(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case4(cuts, p, p0, pVt, k, c)
                 elif p[k] + 2 < len(w) and w[p[k] + 2] in G:
-                    w, p0, k, c, p, pVt = case5(w, p, p0, pVt, k, c)
+                    cuts, p0, k, c, p, pVt = case5(cuts, p, p0, pVt, k, c)
 
             p0 += 1
+            # The cases only insert the boundaries: read them back once
+            w = cuts.text()
 
         s = re.sub(r"\-+", "-", w)
 
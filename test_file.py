@@ -5,19 +5,22 @@ from __future__ import unicode_literals
 
 from argparse import ArgumentParser
 
-from g2p.g2p import G2PTranscriber
+from g2p.g2p import transcribe_iter, transcribe_frequencies, analyze_iter, MODES
+from g2p.parallel import transcribe_parallel
+from g2p.cache import LRUCache
+from g2p.store import SQLiteStore
+from g2p.lexicon import Lexicon, check_lexicon
+from g2p.streams import open_input, open_output
 
 import os
-import codecs
+import sys
 
 
 def is_valid_file(parser, arg):
-    if not os.path.exists(arg):
+    if arg != "-" and not os.path.exists(arg):
         parser.error('the file "%s" does not exist!' % arg)
-    elif not arg.endswith(".txt"):
-        parser.error('"%s" is not a text file!' % arg)
     else:
-        return codecs.open(arg, "r", "utf-8")  # return an open file handle
+        return arg
 
 
 if __name__ == "__main__":
@@ -37,30 +40,170 @@ if __name__ == "__main__":
         "-f",
         "--file",
         dest="file",
-        required=True,
-        help="Text file",
+        default="-",
+        help="Text file, one word per line, may be gzip/xz compressed "
+        "(default: stdin)",
         type=lambda x: is_valid_file(parser, x),
     )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default="output.txt",
+        help='Output file, compressed if it ends in ".gz" or ".xz", '
+        'or "-" for stdout (default: output.txt)',
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        dest="cache",
+        default=0,
+        type=int,
+        help="Cache the results of the N most recently used words",
+    )
+    parser.add_argument(
+        "-d",
+        "--db",
+        dest="db",
+        default=None,
+        help="SQLite file of the persistent cache, reused between runs",
+    )
+    parser.add_argument(
+        "--prune",
+        dest="prune",
+        action="store_true",
+        help="Remove the results of the other rule versions from the -d file",
+    )
+    parser.add_argument(
+        "-l",
+        "--lexicon",
+        dest="lexicon",
+        default=None,
+        help="Compiled lexicon looked up before the rules (python -m g2p.lexicon)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        dest="workers",
+        default=0,
+        type=int,
+        help="Transcribe in N processes (default: 0, in this process)",
+    )
+    parser.add_argument(
+        "-u",
+        "--unique",
+        dest="unique",
+        action="store_true",
+        help="Transcribe the repeated words of a chunk (1000 words) once; the "
+        "words repeated across chunks are found with -c, or -F",
+    )
+    parser.add_argument(
+        "-F",
+        "--frequencies",
+        dest="frequencies",
+        action="store_true",
+        help="Write a table of the distinct words: word, frequency, "
+        "transcription, syllables and stress syllables",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        dest="mode",
+        default="all",
+        choices=["all"] + list(MODES),
+        help="Write only the syllable count, the syllables or the stress "
+        "syllable, without the phonetic rules (default: all)",
+    )
     args = parser.parse_args()
+    if args.prune and not args.db:
+        parser.error("--prune needs the SQLite file (-d)")
+    if args.mode != "all" and (
+        args.cache
+        or args.db
+        or args.lexicon
+        or args.workers
+        or args.unique
+        or args.frequencies
+    ):
+        parser.error("-c, -d, -l, -w, -u and -F need the transcription (-m all)")
+
+    if args.lexicon and not os.path.exists(args.lexicon):
+        parser.error('the file "%s" does not exist!' % args.lexicon)
+    if args.lexicon:
+        try:
+            check_lexicon(args.lexicon, args.separator)
+        except (IOError, ValueError) as e:
+            parser.error(str(e))
+
+    # Messages go to stderr when the results go to stdout
+    log = sys.stderr if args.output == "-" else sys.stdout
 
-    # Open output file
-    f = codecs.open("output.txt", "w", "utf-8")
-    # Iterate input file
-    for line in args.file.readlines():
-        # Get input word
-        word = line.strip().lower()
-        # Initialize g2p transcriber
-        g2p = G2PTranscriber(word, algorithm=args.separator)
+    # Open input and output files
+    f_in, f = open_input(args.file), open_output(args.output)
+    # Get input words, line by line
+    words = (line.strip().lower() for line in f_in)
+    # Persistent cache of the previous runs
+    store = SQLiteStore(args.db, prune=args.prune) if args.db else None
+    cache = None
+    if args.mode == "all" and args.workers > 0:
+        # Transcribe in a pool of processes, each with its own cache
+        transcribe = transcribe_parallel
+        kwargs = dict(
+            workers=args.workers, cache=args.cache, store=store, lexicon=args.lexicon
+        )
+    elif args.mode == "all":
+        # Cache of the repeated words
+        cache = LRUCache(args.cache) if args.cache > 0 else None
+        # Compiled lexicon of the known words
+        lexicon = Lexicon(args.lexicon) if args.lexicon else None
+        # Transcribe all words with a single g2p transcriber per chunk
+        transcribe = transcribe_iter
+        kwargs = dict(cache=cache, store=store, lexicon=lexicon)
+    if args.mode != "all":
+        # Count, syllables or stress syllable only, with a single transcriber
+        for result in analyze_iter(words, args.separator, args.mode):
+            f.write("{0} -> {1}\r\n".format(result["word"], result[MODES[args.mode]]))
+        results = []
+    elif args.frequencies:
+        # Frequency table of the distinct words, from the most frequent word
+        results = transcribe_frequencies(
+            words, args.separator, transcribe=transcribe, **kwargs
+        )
+        for result in results:
+            f.write(
+                "{0}\t{1}\t{2}\t{3}\t{4}\r\n".format(
+                    result["word"],
+                    result["frequency"],
+                    result["transcription"],
+                    result["syllables"],
+                    result["stress_syllables"],
+                )
+            )
+        results = []
+    else:
+        results = transcribe(words, args.separator, dedup=args.unique, **kwargs)
+    for result in results:
         # Write file
         f.write(
             "{0} -> [{1}] | {2} | {3}\r\n".format(
-                word,
-                g2p.transcriber(),
-                g2p.get_syllables_with_hyphen(),
-                g2p.get_syllables_with_stress_boundaries(),
+                result["word"],
+                result["transcription"],
+                result["syllables"],
+                result["stress_syllables"],
             )
         )
-    # Close output file
+    # Close input and output files
+    f_in.close()
     f.close()
+    if store is not None:
+        store.close()
 
-    print('\nSuccess!!! Open the "output.txt" file to see the result.\n')
+    if cache is not None:
+        log.write("\nCache: {0}\n".format(cache.stats()))
+
+    if args.output != "-":
+        log.write(
+            '\nSuccess!!! Open the "{0}" file to see the result.\n\n'.format(
+                args.output
+            )
+        )
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+from __future__ import unicode_literals
+
+from argparse import ArgumentParser
+
+from g2p.text import transcribe_text
+from g2p.cache import LRUCache
+from g2p.lexicon import Lexicon, check_lexicon
+from g2p.streams import open_input, open_output
+
+import os
+import sys
+
+
+def is_valid_file(parser, arg):
+    if arg != "-" and not os.path.exists(arg):
+        parser.error('the file "%s" does not exist!' % arg)
+    else:
+        return arg
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser()
+    # Parse command line arguments
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separator",
+        required=True,
+        type=str,
+        choices=["silva", "ceci"],
+        help="Select the separator/syllabification algorithm",
+    )
+    parser.add_argument(
+        "-f",
+        "--file",
+        dest="file",
+        default="-",
+        help="Running text, may be gzip/xz compressed (default: stdin)",
+        type=lambda x: is_valid_file(parser, x),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default="-",
+        help='Output file, compressed if it ends in ".gz" or ".xz", '
+        'or "-" for stdout (default: stdout)',
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        dest="cache",
+        default=10000,
+        type=int,
+        help="Cache the results of the N most recently used words "
+        "(default: 10000)",
+    )
+    parser.add_argument(
+        "-l",
+        "--lexicon",
+        dest="lexicon",
+        default=None,
+        help="Compiled lexicon looked up before the rules (python -m g2p.lexicon)",
+    )
+    args = parser.parse_args()
+    if args.lexicon and not os.path.exists(args.lexicon):
+        parser.error('the file "%s" does not exist!' % args.lexicon)
+    if args.lexicon:
+        try:
+            check_lexicon(args.lexicon, args.separator)
+        except (IOError, ValueError) as e:
+            parser.error(str(e))
+
+    # Open input and output files, the offsets count every input character
+    f_in, f = open_input(args.file, newline=""), open_output(args.output)
+    # Cache of the repeated words
+    cache = LRUCache(args.cache) if args.cache > 0 else None
+    # Compiled lexicon of the known words
+    lexicon = Lexicon(args.lexicon) if args.lexicon else None
+    # Write a line per word: start, end, token, transcription, syllables and
+    # stress syllables, separated by tabs
+    for item in transcribe_text(
+        f_in, algorithm=args.separator, cache=cache, lexicon=lexicon
+    ):
+        if not item["is_word"]:
+            continue
+        result = item["result"] or {}
+        f.write(
+            "{0}\t{1}\t{2}\t{3}\t{4}\t{5}\r\n".format(
+                item["start"],
+                item["end"],
+                item["token"],
+                result.get("transcription", ""),
+                result.get("syllables", ""),
+                result.get("stress_syllables", ""),
+            )
+        )
+    # Close input and output files
+    f_in.close()
+    f.close()
+
+    if args.output != "-":
+        sys.stdout.write(
+            '\nSuccess!!! Open the "{0}" file to see the result.\n\n'.format(
+                args.output
+            )
+        )
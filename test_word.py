@@ -5,7 +5,7 @@ from __future__ import unicode_literals
 
 from argparse import ArgumentParser
 
-from g2p.g2p import G2PTranscriber
+from g2p.g2p import G2PTranscriber, MODES, analyze_iter
 
 
 if __name__ == "__main__":
@@ -22,20 +22,46 @@ if __name__ == "__main__":
         help="Select the separator/syllabification algorithm",
     )
     parser.add_argument("-w", "--word", dest="word", required=True, help="Word")
+    parser.add_argument(
+        "-m",
+        "--mode",
+        dest="mode",
+        default="all",
+        choices=["all"] + list(MODES),
+        help="Output only the syllable count, the syllables or the stress "
+        "syllable, without the phonetic rules (default: all)",
+    )
+    parser.add_argument(
+        "-e",
+        "--explain",
+        dest="explain",
+        action="store_true",
+        help="Print the rules the word goes through, in order",
+    )
     args = parser.parse_args()
     # Get the input word
     try:
         word = args.word.decode("utf-8").lower()
     except:
         word = args.word.lower()
-    # Initialize G2P transcriber
-    g2p = G2PTranscriber(word, algorithm=args.separator)
-
-    print(
-        "\n{0} -> [{1}] | {2} | {3}\n".format(
-            word,
-            g2p.transcriber(),
-            g2p.get_syllables_with_hyphen(),
-            g2p.get_syllables_with_stress_boundaries(),
+    if args.mode != "all":
+        result = next(analyze_iter([word], args.separator, args.mode))
+        print("\n{0} -> {1}\n".format(word, result[MODES[args.mode]]))
+    else:
+        # Initialize G2P transcriber
+        g2p = G2PTranscriber(word, algorithm=args.separator)
+
+        print(
+            "\n{0} -> [{1}] | {2} | {3}\n".format(
+                word,
+                g2p.transcriber(),
+                g2p.get_syllables_with_hyphen(),
+                g2p.get_syllables_with_stress_boundaries(),
+            )
         )
-    )
+
+    if args.explain:
+        # Imported here, so that the plain transcription starts as fast as before
+        from g2p.explain import explain, format_trace
+
+        print("\n".join(format_trace(explain(word, args.separator)["trace"])) + "\n")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# test_golden.py - Golden output of the phonetic rules on a real word list,
+# for both algorithms
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import codecs
+import os
+
+from argparse import ArgumentParser
+
+import pytest
+
+from benchmarks.suite import load_words
+from g2p.g2p import transcribe_many
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+# Real word list of benchmarks/words
+WORDS = "real-mixed"
+
+ALGORITHMS = ["silva", "ceci"]
+
+# Output of the words the rules cannot transcribe, e.g. IndexError
+ERROR = "!error"
+
+
+def golden_path(algorithm):
+    return os.path.join(GOLDEN, "%s.%s.tsv" % (WORDS, algorithm))
+
+
+def transcribe(word, algorithm):
+    """
+    Returns the row of a word: word, transcription, syllables and stress
+    syllables, or the ERROR marker for the words in error.
+
+    """
+    try:
+        result = transcribe_many([word], algorithm)[0]
+    except (IndexError, ValueError):
+        return [word, ERROR, ERROR, ERROR]
+    return [
+        word,
+        result["transcription"],
+        result["syllables"],
+        result["stress_syllables"],
+    ]
+
+
+def read_golden(algorithm):
+    with codecs.open(golden_path(algorithm), "r", "utf-8") as f:
+        return [line.rstrip("\n").split("\t") for line in f]
+
+
+def write_golden(algorithm):
+    with codecs.open(golden_path(algorithm), "w", "utf-8") as f:
+        for word in load_words(WORDS):
+            f.write("\t".join(transcribe(word, algorithm)) + "\n")
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_golden(algorithm):
+    golden = read_golden(algorithm)
+    assert [row[0] for row in golden] == load_words(WORDS)
+    mismatches = [
+        (expected, actual)
+        for expected, actual in (
+            (row, transcribe(row[0], algorithm)) for row in golden
+        )
+        if expected != actual
+    ]
+    assert mismatches[:10] == [], "%d mismatches" % len(mismatches)
+
+
+if __name__ == "__main__":
+    # Initialize ArgumentParser class
+    parser = ArgumentParser(
+        description="Rewrite the golden output after an intended change of "
+        "the rules"
+    )
+    parser.add_argument(
+        "-s",
+        "--separator",
+        dest="separators",
+        action="append",
+        choices=ALGORITHMS,
+        help="Algorithm to rewrite (default: both)",
+    )
+    args = parser.parse_args()
+
+    for algorithm in args.separators or ALGORITHMS:
+        write_golden(algorithm)
+        print("wrote %s" % golden_path(algorithm))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# test_lexicon.py - Compiled lexicon files
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import pytest
+
+from g2p.g2p import transcribe_many
+from g2p.lexicon import HEADER, Lexicon, build_lexicon, check_lexicon
+
+WORDS = ["guerra", "molho", "casa"]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "silva.lex")
+    build_lexicon(WORDS, path, "silva")
+    return path
+
+
+def test_get(path):
+    with Lexicon(path) as lexicon:
+        assert lexicon.algorithm == "silva"
+        assert len(lexicon) == len(WORDS)
+        assert [lexicon.get(word) for word in WORDS] == transcribe_many(WORDS)
+        assert lexicon.get("chocolate") is None
+
+
+@pytest.mark.parametrize("size", [0, 3, HEADER.size - 1, HEADER.size + 2])
+def test_truncated(path, size):
+    with open(path, "rb") as f:
+        data = f.read(size)
+    with open(path, "wb") as f:
+        f.write(data)
+    with pytest.raises(ValueError):
+        Lexicon(path)
+
+
+def test_check_algorithm(path):
+    assert check_lexicon(path, "silva")
+    with pytest.raises(ValueError):
+        check_lexicon(path, "ceci")
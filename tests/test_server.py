@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# test_server.py - HTTP transcription service
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import pytest
+import asyncio
+import json
+
+from g2p.server import MAX_BODY, TranscriptionService
+
+
+async def exchange(data, count):
+    """
+    Send raw requests on a single connection to a service transcribing in
+    this process, and return up to count responses, fewer if the server
+    closes the connection.
+
+    """
+    service = TranscriptionService(workers=0)
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        await writer.drain()
+        responses = []
+        while len(responses) < count:
+            line = await asyncio.wait_for(reader.readline(), 10)
+            if not line:
+                break
+            headers = {}
+            while True:
+                header = await reader.readline()
+                if not header.strip():
+                    break
+                name, _, value = header.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers["content-length"]))
+            responses.append(
+                (int(line.split()[1]), headers["connection"], json.loads(body))
+            )
+        writer.close()
+    finally:
+        await service.close()
+
+    return responses
+
+
+def request(body, length=None):
+    return (
+        "POST /transcribe HTTP/1.1\r\nContent-Length: {0}\r\n\r\n".format(
+            len(body) if length is None else length
+        ).encode("latin-1")
+        + body
+    )
+
+
+def test_keep_alive():
+    responses = asyncio.run(
+        exchange(request(b'{"word": "casa"}') + b"GET /health HTTP/1.1\r\n\r\n", 2)
+    )
+    assert [status for status, _, _ in responses] == [200, 200]
+    assert responses[0][1] == "keep-alive"
+    assert responses[0][2]["results"][0]["transcription"] == "ˈka.za"
+
+
+def test_body_too_large():
+    # The unread body holds a request that must not be answered
+    responses = asyncio.run(
+        exchange(
+            request(b"GET /health HTTP/1.1\r\n\r\n", length=MAX_BODY + 1)
+            + request(b'{"word": "casa"}'),
+            2,
+        )
+    )
+    assert responses == [(413, "close", {"error": "request body too large"})]
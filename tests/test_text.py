@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- encoding:utf-8 -*-
+
+# test_text.py - Transcription of running text
+# Copyright (C) 2015  Alessandro Bokan
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General Public License for
+# more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# Authors:  Alessandro Bokan <alessandro.bokan@gmail.com>
+
+from __future__ import unicode_literals
+
+import pytest
+import pytest
+
+from g2p.g2p import transcribe_many
+from g2p.lexicon import Lexicon, build_lexicon
+from g2p.text import tokenize, transcribe_text
+
+TEXT = ["A guerra, gu e casa.\n"]
+
+
+def results(**kwargs):
+    return [
+        (item["token"], item["result"])
+        for item in transcribe_text(TEXT, **kwargs)
+        if item["is_word"]
+    ]
+
+
+def test_tokenize():
+    assert list(tokenize("Dá-lo, d'água.")) == [
+        ("Dá", 0, 2, True),
+        ("-", 2, 3, False),
+        ("lo", 3, 5, True),
+        (",", 5, 6, False),
+        ("d'água", 7, 13, True),
+        (".", 13, 14, False),
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ["silva", "ceci"])
+def test_rule_failure(algorithm):
+    # "gu" breaks the rules, the other words of the chunk are transcribed
+    with pytest.raises(IndexError):
+        transcribe_many(["gu"], algorithm)
+    assert results(algorithm=algorithm) == [
+        (word, None if word == "gu" else transcribe_many([word], algorithm)[0])
+        for word in ["A", "guerra", "gu", "e", "casa"]
+    ]
+
+
+def test_lexicon_of_other_algorithm(tmp_path):
+    path = str(tmp_path / "silva.lex")
+    build_lexicon(["guerra", "casa"], path, "silva")
+    with Lexicon(path) as lexicon:
+        assert results(algorithm="ceci", lexicon=lexicon) == results(
+            algorithm="ceci"
+        )
+        assert results(algorithm="silva", lexicon=lexicon) == results(
+            algorithm="silva"
+        )